@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
-import datetime as dt
 import json
 import os
 import shlex
@@ -29,12 +28,26 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
+import traceback
+from collections import Counter
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from fault_inject import FaultResult
 from profile_loader import ProfileConfig, load_profile
+from write_trace_heuristic import classify_trace, load_trace, summarize_classification
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 DEFAULT_RENODE_TEST = os.environ.get("RENODE_TEST", "renode-test")
 DEFAULT_ROBOT_SUITE = "tests/ota_fault_point.robot"
@@ -50,7 +63,7 @@ def parse_args() -> argparse.Namespace:
         "--profile", required=True,
         help="Path to a YAML bootloader profile.",
     )
-    parser.add_argument("--output", required=True, help="Output JSON report path.")
+    parser.add_argument("--output", required=True, help="Output report path (JSON, or msgpack with --report-format msgpack).")
     parser.add_argument(
         "--evaluation-mode",
         choices=("state", "execute"),
@@ -104,7 +117,18 @@ def parse_args() -> argparse.Namespace:
         "--no-trace-replay", action="store_true",
         help="Disable trace replay optimization; force full CPU execution for every fault point.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--compact-report", action="store_true",
+        help="Write the report without indentation or key sorting (faster for large sweeps; not for committed results).",
+    )
+    parser.add_argument(
+        "--report-format", choices=("json", "msgpack"), default="json",
+        help="Report encoding. msgpack is a compact binary form for machine consumers and needs the msgpack package. Default: json.",
+    )
+    args = parser.parse_args()
+    if args.report_format == "msgpack" and msgpack is None:
+        parser.error("--report-format msgpack requires the msgpack package")
+    return args
 
 
 def ensure_tool(path: str) -> str:
@@ -126,7 +150,7 @@ def parse_robot_vars(raw_vars: List[str]) -> List[str]:
         key, sep, value = rv.partition(":")
         if not sep or not key or not value:
             raise ValueError("--robot-var must use KEY:VALUE, got '{}'".format(rv))
-        parsed.append("{}:{}".format(key, value))
+        parsed.append(f"{key}:{value}")
     return parsed
 
 
@@ -137,6 +161,27 @@ def quick_subset(points: List[int]) -> List[int]:
     return sorted(set([points[0], points[mid], points[-1]]))
 
 
+def load_result_json(path: Path) -> Any:
+    """Parse a renode-test result file, using orjson when it is installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity or integers wider than 64 bits; the stdlib accepts both.
+            pass
+    return json.loads(raw)
+
+
+def renode_test_env(work_dir: Path) -> Dict[str, str]:
+    """Build the renode-test environment, sharing work_dir's .NET bundle cache."""
+    bundle_dir = work_dir / ".dotnet_bundle"
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env.setdefault("DOTNET_BUNDLE_EXTRACT_BASE_DIR", str(bundle_dir))
+    return env
+
+
 def run_single_point(
     repo_root: Path,
     renode_test: str,
@@ -148,35 +193,37 @@ def run_single_point(
     renode_remote_server_dir: str,
     is_control: bool = False,
     calibration: bool = False,
+    env: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    """Run a single fault point (or calibration) via renode-test."""
+    """Run a single fault point (or calibration) via renode-test.
+
+    ``env`` may be precomputed with :func:`renode_test_env` by callers that
+    launch many points against the same work_dir.
+    """
     label = "calibration" if calibration else ("control" if is_control else "fault_{}".format(fault_at))
     point_dir = work_dir / "{}_{}".format(profile.name, label)
     point_dir.mkdir(parents=True, exist_ok=True)
 
     result_file = point_dir / "result.json"
     rf_results = point_dir / "robot"
-    bundle_dir = work_dir / ".dotnet_bundle"
     renode_config = work_dir / "renode.config"
-    bundle_dir.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         renode_test,
         "--renode-config", str(renode_config),
         robot_suite,
         "--results-dir", str(rf_results),
-        "--variable", "FAULT_AT:{}".format(fault_at),
-        "--variable", "RESULT_FILE:{}".format(result_file),
-        "--variable", "CALIBRATION_MODE:{}".format("true" if calibration else "false"),
+        "--variable", f"FAULT_AT:{fault_at}",
+        "--variable", f"RESULT_FILE:{result_file}",
+        "--variable", f"CALIBRATION_MODE:{'true' if calibration else 'false'}",
     ]
     if renode_remote_server_dir:
         cmd.extend(["--robot-framework-remote-server-full-directory", renode_remote_server_dir])
 
-    for rv in robot_vars:
-        cmd.extend(["--variable", rv])
+    cmd.extend(arg for rv in robot_vars for arg in ("--variable", rv))
 
-    env = os.environ.copy()
-    env.setdefault("DOTNET_BUNDLE_EXTRACT_BASE_DIR", str(bundle_dir))
+    if env is None:
+        env = renode_test_env(work_dir)
 
     proc = subprocess.run(
         cmd, cwd=str(repo_root),
@@ -193,7 +240,7 @@ def run_single_point(
     if not result_file.exists():
         raise RuntimeError("Run did not produce {}".format(result_file))
 
-    return json.loads(result_file.read_text(encoding="utf-8"))
+    return load_result_json(result_file)
 
 
 @dataclasses.dataclass
@@ -264,6 +311,7 @@ def run_batch(
     trace_file: Optional[str] = None,
     erase_trace_file: Optional[str] = None,
     fault_types_list: Optional[List[str]] = None,
+    env: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Run multiple fault points in a single Renode session (batch mode).
 
@@ -274,9 +322,7 @@ def run_batch(
 
     result_file = batch_dir / "result.json"
     rf_results = batch_dir / "robot"
-    bundle_dir = work_dir / ".dotnet_bundle"
     renode_config = work_dir / "renode.config"
-    bundle_dir.mkdir(parents=True, exist_ok=True)
 
     csv = ",".join(str(fp) for fp in fault_points)
     ft_csv = ",".join(fault_types_list) if fault_types_list else ""
@@ -298,23 +344,22 @@ def run_batch(
         "--renode-config", str(renode_config),
         robot_suite,
         "--results-dir", str(rf_results),
-        "--variable", "FAULT_POINTS_CSV:{}".format(csv),
+        "--variable", f"FAULT_POINTS_CSV:{csv}",
         "--variable", "FAULT_AT:0",
-        "--variable", "RESULT_FILE:{}".format(result_file),
+        "--variable", f"RESULT_FILE:{result_file}",
         "--variable", "CALIBRATION_MODE:false",
-        "--variable", "TRACE_FILE:{}".format(trace_file or ""),
-        "--variable", "ERASE_TRACE_FILE:{}".format(erase_trace_file or ""),
-        "--variable", "FAULT_TYPES:{}".format(fault_types_mode),
-        "--variable", "FAULT_TYPE_CSV:{}".format(ft_csv),
+        "--variable", f"TRACE_FILE:{trace_file or ''}",
+        "--variable", f"ERASE_TRACE_FILE:{erase_trace_file or ''}",
+        "--variable", f"FAULT_TYPES:{fault_types_mode}",
+        "--variable", f"FAULT_TYPE_CSV:{ft_csv}",
     ]
     if renode_remote_server_dir:
         cmd.extend(["--robot-framework-remote-server-full-directory", renode_remote_server_dir])
 
-    for rv in robot_vars:
-        cmd.extend(["--variable", rv])
+    cmd.extend(arg for rv in robot_vars for arg in ("--variable", rv))
 
-    env = os.environ.copy()
-    env.setdefault("DOTNET_BUNDLE_EXTRACT_BASE_DIR", str(bundle_dir))
+    if env is None:
+        env = renode_test_env(work_dir)
 
     proc = subprocess.run(
         cmd, cwd=str(repo_root),
@@ -331,7 +376,7 @@ def run_batch(
     if not result_file.exists():
         raise RuntimeError("Batch run did not produce {}".format(result_file))
 
-    data = json.loads(result_file.read_text(encoding="utf-8"))
+    data = load_result_json(result_file)
     if isinstance(data, list):
         return data
     return [data]
@@ -371,6 +416,7 @@ def run_classic_sweep(
 ) -> List[Dict[str, Any]]:
     """Run fault sweep using classic per-point .resc (for resilient/vulnerable scenarios)."""
     results: List[Dict[str, Any]] = []
+    env = renode_test_env(work_dir)
 
     for fp in fault_points:
         data = run_single_point(
@@ -382,6 +428,7 @@ def run_classic_sweep(
             robot_vars=robot_vars,
             work_dir=work_dir,
             renode_remote_server_dir=renode_remote_server_dir,
+            env=env,
         )
         result = normalize_classic_result(data, fp)
         result["is_control"] = False
@@ -400,6 +447,7 @@ def run_classic_sweep(
             work_dir=work_dir,
             renode_remote_server_dir=renode_remote_server_dir,
             is_control=True,
+            env=env,
         )
         result = normalize_classic_result(data, control_at)
         result["is_control"] = True
@@ -470,6 +518,7 @@ def _run_batch_worker(
         trace_file=trace_file,
         erase_trace_file=erase_trace_file,
         fault_types_list=fault_types_list,
+        env=renode_test_env(worker_dir),
     )
 
 
@@ -500,6 +549,8 @@ def run_runtime_sweep(
 
     fault_types_list: parallel list of per-point fault type codes.
     """
+    env = renode_test_env(work_dir)
+
     if fault_points and num_workers > 1:
         # Split fault points into roughly equal chunks.
         n = min(num_workers, len(fault_points))
@@ -567,6 +618,7 @@ def run_runtime_sweep(
             trace_file=trace_file,
             erase_trace_file=erase_trace_file,
             fault_types_list=fault_types_list,
+            env=env,
         )
     else:
         batch_results = []
@@ -590,6 +642,7 @@ def run_runtime_sweep(
             work_dir=work_dir,
             renode_remote_server_dir=renode_remote_server_dir,
             is_control=True,
+            env=env,
         )
         data["is_control"] = True
         results.append(data)
@@ -655,35 +708,38 @@ def summarize_runtime_sweep(
     profile: Optional["ProfileConfig"] = None,
 ) -> Dict[str, Any]:
     """Compute summary statistics from runtime sweep results."""
-    non_control = [r for r in results if not r.get("is_control", False)]
-    control = [r for r in results if r.get("is_control", False)]
-
-    # Fail-closed: exclude points where fault didn't actually fire.
-    injected = [r for r in non_control if r.get("fault_injected", False)]
-    not_injected = [r for r in non_control if not r.get("fault_injected", False)]
-
-    total = len(injected)
-    failures = [r for r in injected if r.get("boot_outcome") != "success"]
-    recoveries = sum(1 for r in injected if r.get("boot_outcome") == "success")
+    # Partition in a single pass.  Fail-closed: points where the fault
+    # didn't actually fire are discarded rather than counted as recoveries.
+    control: List[Dict[str, Any]] = []
+    failures: List[Dict[str, Any]] = []
+    total = 0
+    not_injected = 0
+    for r in results:
+        if r.get("is_control", False):
+            control.append(r)
+        elif not r.get("fault_injected", False):
+            not_injected += 1
+        else:
+            total += 1
+            if r.get("boot_outcome") != "success":
+                failures.append(r)
+    recoveries = total - len(failures)
 
     # Categorize failures by outcome type.
-    outcome_counts: Dict[str, int] = {}
+    outcome_counts = Counter(r.get("boot_outcome", "unknown") for r in failures)
     categorized_failures: List[Dict[str, Any]] = []
-    for r in failures:
-        outcome = r.get("boot_outcome", "unknown")
-        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
-        if profile:
-            categorized_failures.append(
-                categorize_failure(r, total_writes, profile)
-            )
+    if profile:
+        categorized_failures = [
+            categorize_failure(r, total_writes, profile) for r in failures
+        ]
 
     summary: Dict[str, Any] = {
         "total_fault_points": total,
         "bricks": len(failures),
         "recoveries": recoveries,
         "brick_rate": (float(len(failures)) / float(total)) if total else 0.0,
-        "discarded_no_fault_fired": len(not_injected),
-        "failure_outcomes": outcome_counts,
+        "discarded_no_fault_fired": not_injected,
+        "failure_outcomes": dict(outcome_counts),
     }
 
     if categorized_failures:
@@ -758,9 +814,7 @@ def main() -> int:
         if args.keep_run_artifacts:
             execution_dir = repo_root / "results" / "audit_runs"
             execution_dir.mkdir(parents=True, exist_ok=True)
-            work_dir = execution_dir / dt.datetime.now(dt.timezone.utc).strftime(
-                "%Y%m%dT%H%M%SZ"
-            )
+            work_dir = execution_dir / time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
             work_dir.mkdir(parents=True, exist_ok=True)
             report_artifacts_dir = str(work_dir.relative_to(repo_root))
         else:
@@ -859,12 +913,6 @@ def main() -> int:
         )
 
         if use_heuristic:
-            from write_trace_heuristic import (
-                classify_trace,
-                load_trace,
-                summarize_classification,
-            )
-
             trace = load_trace(trace_file)
             slot_ranges_for_heuristic: Dict[str, Tuple[int, int]] = {}
             flash_base = int(profile.memory.slots.get("exec", profile.memory.slots[list(profile.memory.slots.keys())[0]]).base) if profile.memory.slots else 0
@@ -1124,7 +1172,7 @@ def main() -> int:
             },
             "runtime_sweep_results": sweep_results,
             "execution": {
-                "run_utc": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+                "run_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                 "campaign_command": " ".join(shlex.quote(a) for a in command_parts),
                 "artifacts_dir": report_artifacts_dir,
                 "workers": args.workers,
@@ -1138,7 +1186,21 @@ def main() -> int:
 
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        if args.report_format == "msgpack":
+            out_path.write_bytes(msgpack.packb(payload, use_bin_type=True))
+        elif args.compact_report and orjson is not None:
+            # Compact reports are scratch output, so the native encoder is
+            # fine here even though its bytes differ from the stdlib's (float
+            # repr, raw non-ASCII, NaN/Infinity written as null).
+            out_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with out_path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+                if args.compact_report:
+                    # json.dumps (not dump) so the C encoder handles the whole
+                    # payload; it only applies without indentation.
+                    fp.write(json.dumps(payload, separators=(",", ":")))
+                else:
+                    json.dump(payload, fp, indent=2, sort_keys=True)
 
         # Print summary.
         print(json.dumps({
@@ -1169,12 +1231,14 @@ def main() -> int:
         return 0
 
     except Exception as exc:
-        print("INFRASTRUCTURE FAILURE: {}".format(exc), file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        sys.stderr.write("INFRASTRUCTURE FAILURE: {}\n{}".format(exc, traceback.format_exc()))
         return EXIT_INFRA_FAILURE
     finally:
         if temp_ctx is not None:
+            # Make the summary visible before walking the per-point
+            # artifacts, which can take a while after a large sweep.
+            sys.stdout.flush()
+            sys.stderr.flush()
             temp_ctx.cleanup()
 
 
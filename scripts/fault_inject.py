@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Dict, Iterable, List, Optional
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FaultResult:
     fault_at: int
     boot_outcome: str
@@ -17,7 +18,7 @@ class FaultResult:
     is_control: bool = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MultiFaultResult:
     """Result from a multi-fault (sequential interruption) run."""
 
@@ -30,6 +31,29 @@ class MultiFaultResult:
     is_control: bool = False
 
 
+def _field_getter(cls: type) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    return names, operator.attrgetter(*names)
+
+
+_FIELD_GETTERS = {cls: _field_getter(cls) for cls in (FaultResult, MultiFaultResult)}
+
+
+def result_to_dict(result: Union[FaultResult, MultiFaultResult]) -> Dict[str, Any]:
+    """Shallow field dict of a result, in field order, for JSON reports.
+
+    Same keys and values as ``dataclasses.asdict`` but without deep-copying
+    ``nvm_state`` and the per-fault snapshots, which are only serialized.
+    """
+    cls = type(result)
+    entry = _FIELD_GETTERS.get(cls)
+    if entry is None:
+        # Subclasses (or other result dataclasses) get a getter on first use.
+        entry = _FIELD_GETTERS[cls] = _field_getter(cls)
+    names, getter = entry
+    return dict(zip(names, getter(result)))
+
+
 def parse_fault_range(expr: str) -> Iterable[int]:
     start_s, end_s = expr.split(":", 1)
     start = int(start_s)
@@ -56,12 +80,14 @@ def parse_multi_fault_spec(expr: str) -> List[List[int]]:
         run_spec = run_spec.strip()
         if not run_spec:
             continue
-        indices = sorted(int(s.strip()) for s in run_spec.split(","))
+        # int() tolerates surrounding whitespace, so no per-token strip().
+        indices = sorted(map(int, run_spec.split(",")))
         if len(indices) < 2:
             raise ValueError(
                 "multi-fault sequence must have at least 2 fault points, got: {!r}".format(run_spec)
             )
-        if any(idx < 0 for idx in indices):
+        # Sorted, so the first index is the minimum.
+        if indices[0] < 0:
             raise ValueError("fault indices must be non-negative, got: {!r}".format(run_spec))
         sequences.append(indices)
 
@@ -5,51 +5,74 @@ from __future__ import annotations
 
 import argparse
 import struct
+import zlib
 from pathlib import Path
 
 BOOT_META_MAGIC = 0x4F54414D
 BOOT_META_REPLICA_SIZE = 256
 
+# Header words after the magic, in on-flash order (words 1..N of a replica).
+# This tuple is the layout; reordering it changes the binary format.
+BOOT_META_FIELDS = (
+    "seq",
+    "active_slot",
+    "target_slot",
+    "state",
+    "boot_count",
+    "max_boot_count",
+)
+
+# Provisioning defaults: sequence 1, slot A active and confirmed, three
+# trial boots.
+BOOT_META_DEFAULTS = {
+    "seq": 1,
+    "active_slot": 0,
+    "target_slot": 0,
+    "state": 0,
+    "boot_count": 0,
+    "max_boot_count": 3,
+}
+
+_REPLICA_WORDS = BOOT_META_REPLICA_SIZE // 4
+_REPLICA_STRUCT = struct.Struct("<{}I".format(_REPLICA_WORDS))
+
+assert set(BOOT_META_DEFAULTS) == set(BOOT_META_FIELDS), "every header field needs a default"
+# Magic + fields + trailing CRC word must fit in one replica.
+assert 1 + len(BOOT_META_FIELDS) + 1 <= _REPLICA_STRUCT.size // 4, "header does not fit a replica"
+
+
+def boot_meta_header(values: dict[str, int]) -> list[int]:
+    """Return the leading replica words: the magic, then ``values`` in field order."""
+    return [BOOT_META_MAGIC] + [values[name] & 0xFFFFFFFF for name in BOOT_META_FIELDS]
+
 
 def boot_meta_crc(words: list[int]) -> int:
-    crc = 0xFFFFFFFF
-    for word in words[:-1]:
-        for shift in (0, 8, 16, 24):
-            crc ^= (word >> shift) & 0xFF
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0xEDB88320
-                else:
-                    crc >>= 1
-                crc &= 0xFFFFFFFF
-    return crc ^ 0xFFFFFFFF
+    # CRC-32/ISO-HDLC (init 0xFFFFFFFF, poly 0xEDB88320, final xor) over
+    # the little-endian bytes of every word except the trailing CRC slot,
+    # which is exactly what zlib.crc32 computes.
+    payload = struct.pack("<{}I".format(len(words) - 1), *words[:-1])
+    return zlib.crc32(payload) & 0xFFFFFFFF
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate boot metadata blob for demo A/B bootloader")
     parser.add_argument("--output", required=True, help="Output .bin path")
-    parser.add_argument("--active-slot", type=int, default=0, choices=(0, 1))
-    parser.add_argument("--target-slot", type=int, default=0, choices=(0, 1))
-    parser.add_argument("--state", type=int, default=0, help="0=confirmed, 1=pending_test")
-    parser.add_argument("--seq", type=int, default=1)
-    parser.add_argument("--boot-count", type=int, default=0)
-    parser.add_argument("--max-boot-count", type=int, default=3)
+    parser.add_argument("--active-slot", type=int, default=BOOT_META_DEFAULTS["active_slot"], choices=(0, 1))
+    parser.add_argument("--target-slot", type=int, default=BOOT_META_DEFAULTS["target_slot"], choices=(0, 1))
+    parser.add_argument("--state", type=int, default=BOOT_META_DEFAULTS["state"], help="0=confirmed, 1=pending_test")
+    parser.add_argument("--seq", type=int, default=BOOT_META_DEFAULTS["seq"])
+    parser.add_argument("--boot-count", type=int, default=BOOT_META_DEFAULTS["boot_count"])
+    parser.add_argument("--max-boot-count", type=int, default=BOOT_META_DEFAULTS["max_boot_count"])
     args = parser.parse_args()
 
-    words = [0] * (BOOT_META_REPLICA_SIZE // 4)
-    words[0] = BOOT_META_MAGIC
-    words[1] = args.seq & 0xFFFFFFFF
-    words[2] = args.active_slot & 0xFFFFFFFF
-    words[3] = args.target_slot & 0xFFFFFFFF
-    words[4] = args.state & 0xFFFFFFFF
-    words[5] = args.boot_count & 0xFFFFFFFF
-    words[6] = args.max_boot_count & 0xFFFFFFFF
+    header = boot_meta_header({name: getattr(args, name) for name in BOOT_META_FIELDS})
+    words = header + [0] * (_REPLICA_WORDS - len(header))
     words[-1] = boot_meta_crc(words)
 
-    replica = struct.pack("<{}I".format(len(words)), *words)
+    replica = _REPLICA_STRUCT.pack(*words)
     out = Path(args.output)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_bytes(replica + replica)
+    out.write_bytes(replica * 2)
     return 0
 
 
@@ -14,6 +14,7 @@ Usage:
     python3 scripts/geometry_matrix.py --output-dir /tmp/geo_matrix --geometry default small_nvm
     python3 scripts/geometry_matrix.py --output-dir /tmp/geo_matrix --mode mcuboot
     python3 scripts/geometry_matrix.py --output-dir /tmp/geo_matrix --mode all
+    python3 scripts/geometry_matrix.py --output-tar /tmp/geo_matrix.tar --mode all
     python3 scripts/geometry_matrix.py --list
     python3 scripts/geometry_matrix.py --list --mode mcuboot
 """
@@ -22,12 +23,27 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
+import io
+import itertools
 import json
+import os
+import struct
 import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from gen_boot_meta import (
+    BOOT_META_DEFAULTS,
+    BOOT_META_FIELDS,
+    BOOT_META_MAGIC,
+    boot_meta_crc,
+    boot_meta_header,
+)
 
 # ---------------------------------------------------------------------------
 # NVM base address (fixed for all geometries)
@@ -36,11 +52,45 @@ from typing import Any, Dict, List, Optional
 NVM_BASE: int = 0x10000000
 
 
+def _write_file(path: Path, content: Union[str, bytes]) -> None:
+    """Write UTF-8 text (or raw bytes) with one open/write/close, bypassing the text I/O layer."""
+    view = memoryview(content.encode("utf-8") if isinstance(content, str) else content)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Signature shared by _write_file and _tar_writer sinks.
+FileWriter = Callable[[Path, Union[str, bytes]], None]
+
+
+def _tar_writer(tar: tarfile.TarFile) -> FileWriter:
+    """Return a writer that appends each file to ``tar`` instead of the disk.
+
+    Paths are stored as given, so callers pass paths relative to the archive
+    root.
+    """
+    mtime = int(time.time())
+
+    def write(path: Path, content: Union[str, bytes]) -> None:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        info = tarfile.TarInfo(name=path.as_posix())
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = mtime
+        tar.addfile(info, io.BytesIO(data))
+
+    return write
+
+
 # ---------------------------------------------------------------------------
 # GeometryConfig
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GeometryConfig:
     """Describes one NVM memory layout for OTA testing.
 
@@ -59,12 +109,27 @@ class GeometryConfig:
     sram_size: int          # SRAM size in bytes
     name: str               # Human-readable identifier
 
+    @property
+    def slot_a_addr(self) -> int:
+        """Absolute address of slot A."""
+        return NVM_BASE + self.slot_a_offset
+
+    @property
+    def slot_b_addr(self) -> int:
+        """Absolute address of slot B."""
+        return NVM_BASE + self.slot_b_offset
+
+    @property
+    def nvm_ro_alias(self) -> int:
+        """Address of the read-only NVM alias placed just past the NVM window."""
+        return NVM_BASE + self.nvm_size
+
 
 # ---------------------------------------------------------------------------
 # MCUboot-specific geometry config
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SectorRange:
     """One contiguous run of same-sized sectors within a slot."""
 
@@ -72,7 +137,7 @@ class SectorRange:
     size: int         # Size of each sector in bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class MCUbootGeometryConfig(GeometryConfig):
     """Extends GeometryConfig with MCUboot swap-specific layout parameters.
 
@@ -82,12 +147,12 @@ class MCUbootGeometryConfig(GeometryConfig):
     exercise known MCUboot bug classes.
     """
 
-    # Sector map for slot A (list of SectorRange).  If empty, uniform sectors
-    # of `sector_size` are assumed.
-    slot_a_sectors: List[SectorRange] = field(default_factory=list)
+    # Sector map for slot A (sequence of SectorRange, stored as a tuple).  If
+    # empty, uniform sectors of `sector_size` are assumed.
+    slot_a_sectors: Sequence[SectorRange] = field(default_factory=tuple)
 
     # Sector map for slot B.  Same convention.
-    slot_b_sectors: List[SectorRange] = field(default_factory=list)
+    slot_b_sectors: Sequence[SectorRange] = field(default_factory=tuple)
 
     # Uniform sector size (used when slot_*_sectors is empty).
     sector_size: int = 0x1000  # 4KB default
@@ -105,13 +170,33 @@ class MCUbootGeometryConfig(GeometryConfig):
     # Human-readable description of what bug class this geometry targets.
     bug_class: str = ""
 
+    def __post_init__(self) -> None:
+        # Store the sector maps as tuples so they cannot be mutated in place.
+        self.slot_a_sectors = tuple(self.slot_a_sectors)
+        self.slot_b_sectors = tuple(self.slot_b_sectors)
+
+    @property
+    def slot_a_sector_total(self) -> int:
+        """Total size covered by the slot A sector map."""
+        return _sector_total(self.slot_a_sectors)
+
+    @property
+    def slot_b_sector_total(self) -> int:
+        """Total size covered by the slot B sector map."""
+        return _sector_total(self.slot_b_sectors)
+
+    @property
+    def scratch_addr(self) -> int:
+        """Absolute address of the scratch area (only meaningful if scratch_size > 0)."""
+        return NVM_BASE + self.scratch_offset
+
 
-def _sector_total(sectors: List[SectorRange]) -> int:
+def _sector_total(sectors: Sequence[SectorRange]) -> int:
     """Return the total size covered by a sector map."""
     return sum(s.count * s.size for s in sectors)
 
 
-def _largest_sector(sectors: List[SectorRange]) -> int:
+def _largest_sector(sectors: Sequence[SectorRange]) -> int:
     """Return the largest sector size in a sector map."""
     if not sectors:
         return 0
@@ -122,6 +207,17 @@ def _largest_sector(sectors: List[SectorRange]) -> int:
 # Validation
 # ---------------------------------------------------------------------------
 
+# Offsets and sizes that must be multiples of the word size.
+_WORD_ALIGNED_FIELDS = (
+    "slot_a_offset",
+    "slot_a_size",
+    "slot_b_offset",
+    "slot_b_size",
+    "metadata_offset",
+    "metadata_size",
+)
+
+
 def validate_geometry(config: GeometryConfig) -> None:
     """Check that a geometry is internally consistent.
 
@@ -153,22 +249,19 @@ def validate_geometry(config: GeometryConfig) -> None:
     if config.sram_size <= 0:
         errors.append("sram_size must be positive, got {}".format(config.sram_size))
 
-    # Word alignment checks.
+    # Word alignment checks.  Both valid word sizes are powers of two, so a
+    # mask test suffices; an invalid word size was already reported above.
     ws = config.word_size
-    for label, value in [
-        ("slot_a_offset", config.slot_a_offset),
-        ("slot_a_size", config.slot_a_size),
-        ("slot_b_offset", config.slot_b_offset),
-        ("slot_b_size", config.slot_b_size),
-        ("metadata_offset", config.metadata_offset),
-        ("metadata_size", config.metadata_size),
-    ]:
-        if value % ws != 0:
-            errors.append(
-                "{} (0x{:X}) is not aligned to word_size ({} bytes)".format(
-                    label, value, ws
+    if ws in (4, 8):
+        mask = ws - 1
+        for label in _WORD_ALIGNED_FIELDS:
+            value = getattr(config, label)
+            if value & mask:
+                errors.append(
+                    "{} (0x{:X}) is not aligned to word_size ({} bytes)".format(
+                        label, value, ws
+                    )
                 )
-            )
 
     # Regions as (start, end_exclusive, label) for overlap detection.
     regions: List[tuple[int, int, str]] = [
@@ -181,7 +274,11 @@ def validate_geometry(config: GeometryConfig) -> None:
     if config.slot_a_offset > 0:
         regions.append((0, config.slot_a_offset, "boot"))
 
-    # Everything must fit within NVM.
+    # Bounds and overlap checks in one sweep over the regions in start
+    # order.  Each region is only compared against earlier regions that are
+    # still open at its start, instead of against every other region.
+    regions.sort()
+    open_regions: List[tuple[int, int, str]] = []
     for start, end, label in regions:
         if end > config.nvm_size:
             errors.append(
@@ -189,18 +286,15 @@ def validate_geometry(config: GeometryConfig) -> None:
                     label, end, config.nvm_size
                 )
             )
-
-    # Pairwise overlap check.
-    for i in range(len(regions)):
-        for j in range(i + 1, len(regions)):
-            a_start, a_end, a_label = regions[i]
-            b_start, b_end, b_label = regions[j]
-            if a_start < b_end and b_start < a_end:
+        open_regions = [r for r in open_regions if r[1] > start]
+        for a_start, a_end, a_label in open_regions:
+            if a_start < end:
                 errors.append(
                     "{} [0x{:X}, 0x{:X}) overlaps {} [0x{:X}, 0x{:X})".format(
-                        a_label, a_start, a_end, b_label, b_start, b_end
+                        a_label, a_start, a_end, label, start, end
                     )
                 )
+        open_regions.append((start, end, label))
 
     if errors:
         raise ValueError(
@@ -220,7 +314,7 @@ def validate_mcuboot_geometry(config: MCUbootGeometryConfig) -> None:
 
     # Sector maps, if provided, must sum to the slot size.
     if config.slot_a_sectors:
-        total_a = _sector_total(config.slot_a_sectors)
+        total_a = config.slot_a_sector_total
         if total_a != config.slot_a_size:
             errors.append(
                 "slot_a_sectors total ({}) != slot_a_size (0x{:X})".format(
@@ -229,7 +323,7 @@ def validate_mcuboot_geometry(config: MCUbootGeometryConfig) -> None:
             )
 
     if config.slot_b_sectors:
-        total_b = _sector_total(config.slot_b_sectors)
+        total_b = config.slot_b_sector_total
         if total_b != config.slot_b_size:
             errors.append(
                 "slot_b_sectors total ({}) != slot_b_size (0x{:X})".format(
@@ -283,7 +377,9 @@ def validate_mcuboot_geometry(config: MCUbootGeometryConfig) -> None:
 # Platform .repl generation
 # ---------------------------------------------------------------------------
 
-_REPL_TEMPLATE = """\
+# CPU and interrupt controller lines shared by every .repl.  They contain no
+# template fields, so they are kept out of the str.format templates below.
+_REPL_PREFIX = """\
 cpu: CPU.CortexM @ sysbus
     cpuType: "cortex-m0+"
     nvic: nvic
@@ -291,6 +387,9 @@ cpu: CPU.CortexM @ sysbus
 nvic: IRQControllers.NVIC @ sysbus 0xE000E000
     -> cpu@0
 
+"""
+
+_REPL_TEMPLATE = """\
 nvm: Memory.NVMemory @ sysbus 0x{nvm_base:08X}
     Size: 0x{nvm_size:X}
     WordSize: {word_size}
@@ -313,20 +412,22 @@ nvm_ctrl: NVMemoryController @ sysbus 0x40001000
 """
 
 
-def generate_platform_repl(config: GeometryConfig, output_path: Path) -> Path:
+def generate_platform_repl(
+    config: GeometryConfig, output_path: Path, write: FileWriter = _write_file
+) -> Path:
     """Generate a Renode .repl platform description for the given geometry.
 
-    Returns the path to the written file.
+    The parent directory must already exist.  Returns the path to the
+    written file.
     """
-    content = _REPL_TEMPLATE.format(
+    content = _REPL_PREFIX + _REPL_TEMPLATE.format(
         nvm_base=NVM_BASE,
         nvm_size=config.nvm_size,
         word_size=config.word_size,
-        nvm_ro_alias=NVM_BASE + config.nvm_size,
+        nvm_ro_alias=config.nvm_ro_alias,
         sram_size=config.sram_size,
     )
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+    write(output_path, content)
     return output_path
 
 
@@ -335,13 +436,6 @@ def generate_platform_repl(config: GeometryConfig, output_path: Path) -> Path:
 # is configured with SectorLayout hints so the test harness can reason about
 # sector erase boundaries.
 _MCUBOOT_REPL_TEMPLATE = """\
-cpu: CPU.CortexM @ sysbus
-    cpuType: "cortex-m0+"
-    nvic: nvic
-
-nvic: IRQControllers.NVIC @ sysbus 0xE000E000
-    -> cpu@0
-
 nvm: Memory.NVMemory @ sysbus 0x{nvm_base:08X}
     Size: 0x{nvm_size:X}
     WordSize: {word_size}
@@ -373,69 +467,61 @@ scratch: Memory.NVMemory @ sysbus 0x{scratch_addr:08X}
 """
 
 
+def _slot_sector_lines(
+    sectors: Sequence[SectorRange], slot_offset: int, slot_size: int, sector_size: int
+) -> List[str]:
+    """Return the comment lines describing one slot's sector map."""
+    if not sectors:
+        return [
+            "//   {}x 0x{:X} byte uniform sectors".format(slot_size // sector_size, sector_size)
+        ]
+    offsets = itertools.accumulate((sr.count * sr.size for sr in sectors), initial=slot_offset)
+    return [
+        "//   {}x 0x{:X} byte sectors @ offset 0x{:X}".format(sr.count, sr.size, offset)
+        for sr, offset in zip(sectors, offsets)
+    ]
+
+
 def _build_sector_layout_comment(config: MCUbootGeometryConfig) -> str:
     """Build a Renode .repl comment block documenting the sector layout."""
-    lines: List[str] = []
-    lines.append("// MCUboot geometry: {}".format(config.name))
+    header = ["// MCUboot geometry: {}".format(config.name)]
     if config.bug_class:
-        lines.append("// Bug class: {}".format(config.bug_class))
-    lines.append("// Slot A sectors:")
-    if config.slot_a_sectors:
-        offset = config.slot_a_offset
-        for sr in config.slot_a_sectors:
-            lines.append(
-                "//   {}x 0x{:X} byte sectors @ offset 0x{:X}".format(
-                    sr.count, sr.size, offset
-                )
-            )
-            offset += sr.count * sr.size
-    else:
-        n_sectors = config.slot_a_size // config.sector_size
-        lines.append(
-            "//   {}x 0x{:X} byte uniform sectors".format(n_sectors, config.sector_size)
-        )
-    lines.append("// Slot B sectors:")
-    if config.slot_b_sectors:
-        offset = config.slot_b_offset
-        for sr in config.slot_b_sectors:
-            lines.append(
-                "//   {}x 0x{:X} byte sectors @ offset 0x{:X}".format(
-                    sr.count, sr.size, offset
-                )
-            )
-            offset += sr.count * sr.size
-    else:
-        n_sectors = config.slot_b_size // config.sector_size
-        lines.append(
-            "//   {}x 0x{:X} byte uniform sectors".format(n_sectors, config.sector_size)
-        )
+        header.append("// Bug class: {}".format(config.bug_class))
+    trailer: List[str] = []
     if config.scratch_size > 0:
-        lines.append(
+        trailer.append(
             "// Scratch: 0x{:X} bytes @ offset 0x{:X}".format(
                 config.scratch_size, config.scratch_offset
             )
         )
-    lines.append(
+    trailer.append(
         "// Trailer: {} bytes, write_alignment: {} bytes".format(
             config.trailer_size, config.write_alignment
         )
     )
-    lines.append("")
-    return "\n".join(lines)
-
+    trailer.append("")
+    return "\n".join(
+        itertools.chain(
+            header,
+            ["// Slot A sectors:"],
+            _slot_sector_lines(
+                config.slot_a_sectors, config.slot_a_offset, config.slot_a_size, config.sector_size
+            ),
+            ["// Slot B sectors:"],
+            _slot_sector_lines(
+                config.slot_b_sectors, config.slot_b_offset, config.slot_b_size, config.sector_size
+            ),
+            trailer,
+        )
+    )
 
-def generate_mcuboot_platform_repl(
-    config: MCUbootGeometryConfig, output_path: Path
-) -> Path:
-    """Generate a Renode .repl for an MCUboot-specific geometry.
 
-    Includes InjectPartialWrite, sector layout comments, and optional scratch
-    region.  Returns the path to the written file.
-    """
+def _render_mcuboot_repl(config: MCUbootGeometryConfig) -> str:
+    """Render the full MCUboot .repl text, sector layout comment included."""
     extra = ""
     if config.scratch_size > 0:
         extra = _MCUBOOT_SCRATCH_SECTION.format(
-            scratch_addr=NVM_BASE + config.scratch_offset,
+            scratch_addr=config.scratch_addr,
             scratch_size=config.scratch_size,
             word_size=config.word_size,
         )
@@ -444,17 +530,25 @@ def generate_mcuboot_platform_repl(
         nvm_base=NVM_BASE,
         nvm_size=config.nvm_size,
         word_size=config.word_size,
-        nvm_ro_alias=NVM_BASE + config.nvm_size,
+        nvm_ro_alias=config.nvm_ro_alias,
         sram_size=config.sram_size,
         extra_sections=extra,
     )
 
     # Prepend sector layout documentation.
-    comment = _build_sector_layout_comment(config)
-    content = comment + repl_body
+    return _build_sector_layout_comment(config) + _REPL_PREFIX + repl_body
+
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+def generate_mcuboot_platform_repl(
+    config: MCUbootGeometryConfig, output_path: Path, write: FileWriter = _write_file
+) -> Path:
+    """Generate a Renode .repl for an MCUboot-specific geometry.
+
+    Includes InjectPartialWrite, sector layout comments, and optional scratch
+    region.  The parent directory must already exist.  Returns the path to
+    the written file.
+    """
+    write(output_path, _render_mcuboot_repl(config))
     return output_path
 
 
@@ -503,57 +597,41 @@ SECTIONS
 """
 
 
-def generate_linker_scripts(config: GeometryConfig, output_dir: Path) -> Dict[str, Path]:
+def generate_linker_scripts(
+    config: GeometryConfig, output_dir: Path, write: FileWriter = _write_file
+) -> Dict[str, Path]:
     """Generate boot, slot_a, and slot_b linker scripts for the geometry.
 
-    Returns a dict mapping script name to its written path.
+    ``output_dir`` must already exist.  Returns a dict mapping script name
+    to its written path.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
     scripts: Dict[str, Path] = {}
 
+    # (key, file name, region name, origin, length).
+    regions: List[tuple[str, str, str, int, int]] = []
     # Boot linker: [NVM_BASE, NVM_BASE + slot_a_offset).
-    boot_size = config.slot_a_offset
-    if boot_size > 0:
-        boot_path = output_dir / "linker_boot.ld"
-        boot_path.write_text(
+    if config.slot_a_offset > 0:
+        regions.append(("boot", "linker_boot.ld", "BOOT", NVM_BASE, config.slot_a_offset))
+    regions.append(
+        ("slot_a", "linker_slot_a.ld", "SLOTA", config.slot_a_addr, config.slot_a_size)
+    )
+    regions.append(
+        ("slot_b", "linker_slot_b.ld", "SLOTB", config.slot_b_addr, config.slot_b_size)
+    )
+
+    for key, file_name, region_name, origin, length in regions:
+        path = output_dir / file_name
+        write(
+            path,
             _LINKER_TEMPLATE.format(
-                region_name="BOOT",
+                region_name=region_name,
                 region_attrs="rx",
-                origin=NVM_BASE,
-                length=boot_size,
+                origin=origin,
+                length=length,
                 sram_size=config.sram_size,
             ),
-            encoding="utf-8",
         )
-        scripts["boot"] = boot_path
-
-    # Slot A linker.
-    slot_a_path = output_dir / "linker_slot_a.ld"
-    slot_a_path.write_text(
-        _LINKER_TEMPLATE.format(
-            region_name="SLOTA",
-            region_attrs="rx",
-            origin=NVM_BASE + config.slot_a_offset,
-            length=config.slot_a_size,
-            sram_size=config.sram_size,
-        ),
-        encoding="utf-8",
-    )
-    scripts["slot_a"] = slot_a_path
-
-    # Slot B linker.
-    slot_b_path = output_dir / "linker_slot_b.ld"
-    slot_b_path.write_text(
-        _LINKER_TEMPLATE.format(
-            region_name="SLOTB",
-            region_attrs="rx",
-            origin=NVM_BASE + config.slot_b_offset,
-            length=config.slot_b_size,
-            sram_size=config.sram_size,
-        ),
-        encoding="utf-8",
-    )
-    scripts["slot_b"] = slot_b_path
+        scripts[key] = path
 
     return scripts
 
@@ -571,52 +649,76 @@ Two replicas of {replica_size} bytes each.
 """
 
 import struct
+import zlib
 from pathlib import Path
 
-BOOT_META_MAGIC = 0x4F54414D
+BOOT_META_MAGIC = 0x{magic:08X}
 BOOT_META_REPLICA_SIZE = {replica_size}
 
 words = [0] * (BOOT_META_REPLICA_SIZE // 4)
 words[0] = BOOT_META_MAGIC
-words[1] = 1   # seq
-words[2] = 0   # active_slot
-words[3] = 0   # target_slot
-words[4] = 0   # state: confirmed
-words[5] = 0   # boot_count
-words[6] = 3   # max_boot_count
-
-crc = 0xFFFFFFFF
-for w in words[:-1]:
-    for shift in (0, 8, 16, 24):
-        crc ^= (w >> shift) & 0xFF
-        for _ in range(8):
-            crc = (crc >> 1) ^ (0xEDB88320 if (crc & 1) else 0)
-        crc &= 0xFFFFFFFF
-words[-1] = (~crc) & 0xFFFFFFFF
+{header_lines}
+
+# CRC-32 (init 0xFFFFFFFF, poly 0xEDB88320, final xor) over every word but
+# the last, matching boot_meta.h; zlib.crc32 uses the same parameters.
+payload = struct.pack(\'<\' + \'I\' * (len(words) - 1), *words[:-1])
+words[-1] = zlib.crc32(payload) & 0xFFFFFFFF
 
 replica = struct.pack(\'<\' + \'I\' * len(words), *words)
 Path(\'boot_meta.bin\').write_bytes(replica + replica)
 '''
 
 
-def generate_boot_meta_script(config: GeometryConfig, output_path: Path) -> Path:
-    """Generate a gen_boot_meta.py script for the geometry's metadata layout.
+# Initial header words: the magic followed by gen_boot_meta.py's defaults,
+# in its BOOT_META_FIELDS order.
+_BOOT_META_HEADER = tuple(boot_meta_header(BOOT_META_DEFAULTS))
 
-    Returns the path to the written file.
-    """
+
+def _boot_meta_replica_size(config: GeometryConfig) -> int:
+    """Return the per-replica metadata size for the geometry."""
     replica_size = min(config.metadata_size // 2, 256)
     # Ensure at least 256 per replica.
     if replica_size < 256:
         replica_size = 256
+    return replica_size
+
+
+def generate_boot_meta_bin(
+    config: GeometryConfig, output_path: Path, write: FileWriter = _write_file
+) -> Path:
+    """Write the boot_meta.bin that the geometry's gen_boot_meta.py would produce.
+
+    The parent directory must already exist.  Returns the path to the
+    written file.
+    """
+    n_words = _boot_meta_replica_size(config) // 4
+    words = list(_BOOT_META_HEADER) + [0] * (n_words - len(_BOOT_META_HEADER))
+    words[-1] = boot_meta_crc(words)
+    replica = struct.pack("<{}I".format(n_words), *words)
+    write(output_path, replica + replica)
+    return output_path
+
+
+def generate_boot_meta_script(
+    config: GeometryConfig, output_path: Path, write: FileWriter = _write_file
+) -> Path:
+    """Generate a gen_boot_meta.py script for the geometry's metadata layout.
 
+    The parent directory must already exist.  Returns the path to the
+    written file.
+    """
     content = _BOOT_META_TEMPLATE.format(
         name=config.name,
         metadata_offset=config.metadata_offset,
         metadata_size=config.metadata_size,
-        replica_size=replica_size,
+        replica_size=_boot_meta_replica_size(config),
+        magic=BOOT_META_MAGIC,
+        header_lines="\n".join(
+            "words[{}] = {}   # {}".format(i, value, name)
+            for i, (name, value) in enumerate(zip(BOOT_META_FIELDS, _BOOT_META_HEADER[1:]), 1)
+        ),
     )
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+    write(output_path, content)
     return output_path
 
 
@@ -624,6 +726,25 @@ def generate_boot_meta_script(config: GeometryConfig, output_path: Path) -> Path
 # Campaign argument generation
 # ---------------------------------------------------------------------------
 
+_ROBOT_VAR = "--robot-var"
+
+# (value template, config attribute) for every geometry's --robot-var args.
+_CAMPAIGN_VARS = (
+    ("NVM_SIZE:0x{:X}", "nvm_size"),
+    ("NVM_WORD_SIZE:{}", "word_size"),
+    ("SLOT_A_OFFSET:0x{:X}", "slot_a_offset"),
+    ("SLOT_A_SIZE:0x{:X}", "slot_a_size"),
+    ("SLOT_A_ADDR:0x{:08X}", "slot_a_addr"),
+    ("SLOT_B_OFFSET:0x{:X}", "slot_b_offset"),
+    ("SLOT_B_SIZE:0x{:X}", "slot_b_size"),
+    ("SLOT_B_ADDR:0x{:08X}", "slot_b_addr"),
+    ("METADATA_OFFSET:0x{:X}", "metadata_offset"),
+    ("METADATA_SIZE:0x{:X}", "metadata_size"),
+    ("SRAM_SIZE:0x{:X}", "sram_size"),
+    ("GEOMETRY_NAME:{}", "name"),
+)
+
+
 def generate_campaign_args(config: GeometryConfig) -> List[str]:
     """Return --robot-var arguments for the campaign runner to use this geometry.
 
@@ -631,20 +752,10 @@ def generate_campaign_args(config: GeometryConfig) -> List[str]:
     invocation so that the Robot test picks up the correct platform file,
     slot addresses, and metadata location.
     """
-    args: List[str] = [
-        "--robot-var", "NVM_SIZE:0x{:X}".format(config.nvm_size),
-        "--robot-var", "NVM_WORD_SIZE:{}".format(config.word_size),
-        "--robot-var", "SLOT_A_OFFSET:0x{:X}".format(config.slot_a_offset),
-        "--robot-var", "SLOT_A_SIZE:0x{:X}".format(config.slot_a_size),
-        "--robot-var", "SLOT_A_ADDR:0x{:08X}".format(NVM_BASE + config.slot_a_offset),
-        "--robot-var", "SLOT_B_OFFSET:0x{:X}".format(config.slot_b_offset),
-        "--robot-var", "SLOT_B_SIZE:0x{:X}".format(config.slot_b_size),
-        "--robot-var", "SLOT_B_ADDR:0x{:08X}".format(NVM_BASE + config.slot_b_offset),
-        "--robot-var", "METADATA_OFFSET:0x{:X}".format(config.metadata_offset),
-        "--robot-var", "METADATA_SIZE:0x{:X}".format(config.metadata_size),
-        "--robot-var", "SRAM_SIZE:0x{:X}".format(config.sram_size),
-        "--robot-var", "GEOMETRY_NAME:{}".format(config.name),
-    ]
+    args: List[str] = []
+    for template, attr in _CAMPAIGN_VARS:
+        args.append(_ROBOT_VAR)
+        args.append(template.format(getattr(config, attr)))
     return args
 
 
@@ -660,30 +771,26 @@ def generate_mcuboot_campaign_args(config: MCUbootGeometryConfig) -> List[str]:
 
     # MCUboot-specific vars.
     args.extend([
-        "--robot-var", "TRAILER_SIZE:{}".format(config.trailer_size),
-        "--robot-var", "WRITE_ALIGNMENT:{}".format(config.write_alignment),
-        "--robot-var", "SECTOR_SIZE:0x{:X}".format(config.sector_size),
+        _ROBOT_VAR, f"TRAILER_SIZE:{config.trailer_size}",
+        _ROBOT_VAR, f"WRITE_ALIGNMENT:{config.write_alignment}",
+        _ROBOT_VAR, f"SECTOR_SIZE:0x{config.sector_size:X}",
     ])
 
     if config.scratch_size > 0:
         args.extend([
-            "--robot-var", "SCRATCH_OFFSET:0x{:X}".format(config.scratch_offset),
-            "--robot-var", "SCRATCH_SIZE:0x{:X}".format(config.scratch_size),
-            "--robot-var", "SCRATCH_ADDR:0x{:08X}".format(NVM_BASE + config.scratch_offset),
+            _ROBOT_VAR, f"SCRATCH_OFFSET:0x{config.scratch_offset:X}",
+            _ROBOT_VAR, f"SCRATCH_SIZE:0x{config.scratch_size:X}",
+            _ROBOT_VAR, f"SCRATCH_ADDR:0x{config.scratch_addr:08X}",
         ])
 
     # Sector layout as a serialized string: "count:size,count:size,..."
     if config.slot_a_sectors:
-        sector_str = ",".join(
-            "{}:0x{:X}".format(s.count, s.size) for s in config.slot_a_sectors
-        )
-        args.extend(["--robot-var", "SLOT_A_SECTORS:{}".format(sector_str)])
+        sector_str = ",".join(f"{s.count}:0x{s.size:X}" for s in config.slot_a_sectors)
+        args.extend([_ROBOT_VAR, f"SLOT_A_SECTORS:{sector_str}"])
 
     if config.slot_b_sectors:
-        sector_str = ",".join(
-            "{}:0x{:X}".format(s.count, s.size) for s in config.slot_b_sectors
-        )
-        args.extend(["--robot-var", "SLOT_B_SECTORS:{}".format(sector_str)])
+        sector_str = ",".join(f"{s.count}:0x{s.size:X}" for s in config.slot_b_sectors)
+        args.extend([_ROBOT_VAR, f"SLOT_B_SECTORS:{sector_str}"])
 
     # Compute campaign hints.
     #
@@ -697,13 +804,13 @@ def generate_mcuboot_campaign_args(config: MCUbootGeometryConfig) -> List[str]:
     # injecting a power-cut is meaningful.
     total_writes = config.slot_a_size // config.word_size
     args.extend([
-        "--robot-var", "TOTAL_WRITES:{}".format(total_writes),
-        "--robot-var", "WRITE_GRANULARITY:{}".format(config.word_size),
-        "--robot-var", "FAULT_RANGE:0:{}".format(total_writes),
+        _ROBOT_VAR, f"TOTAL_WRITES:{total_writes}",
+        _ROBOT_VAR, f"WRITE_GRANULARITY:{config.word_size}",
+        _ROBOT_VAR, f"FAULT_RANGE:0:{total_writes}",
     ])
 
     if config.bug_class:
-        args.extend(["--robot-var", "BUG_CLASS:{}".format(config.bug_class)])
+        args.extend([_ROBOT_VAR, f"BUG_CLASS:{config.bug_class}"])
 
     return args
 
@@ -712,6 +819,18 @@ def generate_mcuboot_campaign_args(config: MCUbootGeometryConfig) -> List[str]:
 # MCUboot-specific geometry definitions
 # ---------------------------------------------------------------------------
 
+# Per-slot sector maps shared by both slots of a geometry.
+_ASYMMETRIC_SECTORS: Tuple[SectorRange, ...] = (
+    SectorRange(count=4, size=0x1000),   # 4x 4KB = 16KB
+    SectorRange(count=1, size=0x8000),   # 1x 32KB
+)
+
+_TINY_SCRATCH_SECTORS: Tuple[SectorRange, ...] = (
+    SectorRange(count=8, size=0x1000),   # 8x 4KB = 32KB
+    SectorRange(count=1, size=0x8000),   # 1x 32KB
+)
+
+
 def _mcuboot_asymmetric_sectors() -> MCUbootGeometryConfig:
     """Slot with mixed sector sizes: 4x4KB + 1x32KB = 48KB per slot.
 
@@ -725,11 +844,7 @@ def _mcuboot_asymmetric_sectors() -> MCUbootGeometryConfig:
     #   Slot B:   0xE000 - 0x19FFF (48KB) = 4x4KB + 1x32KB
     #   Metadata: 0x1A000          (512B)
     #   Scratch:  0x1B000 - 0x22FFF (32KB, >= largest sector)
-    slot_sectors = [
-        SectorRange(count=4, size=0x1000),   # 4x 4KB = 16KB
-        SectorRange(count=1, size=0x8000),   # 1x 32KB
-    ]
-    slot_size = _sector_total(slot_sectors)  # 48KB = 0xC000
+    slot_size = _sector_total(_ASYMMETRIC_SECTORS)  # 48KB = 0xC000
 
     return MCUbootGeometryConfig(
         nvm_size=0x40000,           # 256KB
@@ -742,8 +857,8 @@ def _mcuboot_asymmetric_sectors() -> MCUbootGeometryConfig:
         metadata_size=512,
         sram_size=0x20000,
         name="mcuboot_asymmetric_sectors",
-        slot_a_sectors=list(slot_sectors),
-        slot_b_sectors=list(slot_sectors),
+        slot_a_sectors=_ASYMMETRIC_SECTORS,
+        slot_b_sectors=_ASYMMETRIC_SECTORS,
         sector_size=0x1000,         # smallest sector (for reference)
         scratch_offset=0x1B000,
         scratch_size=0x8000,        # 32KB >= largest sector
@@ -886,11 +1001,7 @@ def _mcuboot_tiny_scratch() -> MCUbootGeometryConfig:
     # Layout: 256KB NVM, mixed sectors (8x4KB + 1x32KB = 64KB per slot).
     # Scratch = 4KB (one small sector) but largest sector = 32KB.
     # MCUboot must do 32KB/4KB = 8 passes to swap the large sector.
-    slot_sectors = [
-        SectorRange(count=8, size=0x1000),   # 8x 4KB = 32KB
-        SectorRange(count=1, size=0x8000),   # 1x 32KB
-    ]
-    slot_size = _sector_total(slot_sectors)  # 64KB = 0x10000
+    slot_size = _sector_total(_TINY_SCRATCH_SECTORS)  # 64KB = 0x10000
 
     return MCUbootGeometryConfig(
         nvm_size=0x40000,           # 256KB
@@ -903,8 +1014,8 @@ def _mcuboot_tiny_scratch() -> MCUbootGeometryConfig:
         metadata_size=512,
         sram_size=0x20000,
         name="mcuboot_tiny_scratch",
-        slot_a_sectors=list(slot_sectors),
-        slot_b_sectors=list(slot_sectors),
+        slot_a_sectors=_TINY_SCRATCH_SECTORS,
+        slot_b_sectors=_TINY_SCRATCH_SECTORS,
         sector_size=0x1000,         # smallest sector
         scratch_offset=0x23000,
         scratch_size=0x1000,        # 4KB -- smaller than largest sector (32KB)
@@ -1018,19 +1129,21 @@ def _mcuboot_single_sector_slot() -> MCUbootGeometryConfig:
     )
 
 
-# Collect all MCUboot geometries.
-MCUBOOT_GEOMETRIES: List[MCUbootGeometryConfig] = [
-    _mcuboot_asymmetric_sectors(),
-    _mcuboot_trailer_at_sector_boundary(),
-    _mcuboot_max_size_image(),
-    _mcuboot_tiny_scratch(),
-    _mcuboot_misaligned_slots(),
-    _mcuboot_single_sector_slot(),
-]
+# All MCUboot geometry factories, in matrix order.
+_MCUBOOT_FACTORIES: Tuple[Callable[[], MCUbootGeometryConfig], ...] = (
+    _mcuboot_asymmetric_sectors,
+    _mcuboot_trailer_at_sector_boundary,
+    _mcuboot_max_size_image,
+    _mcuboot_tiny_scratch,
+    _mcuboot_misaligned_slots,
+    _mcuboot_single_sector_slot,
+)
 
-MCUBOOT_GEOMETRIES_BY_NAME: Dict[str, MCUbootGeometryConfig] = {
-    g.name: g for g in MCUBOOT_GEOMETRIES
-}
+
+@functools.lru_cache(maxsize=None)
+def get_mcuboot_geometries() -> Tuple[MCUbootGeometryConfig, ...]:
+    """Return the MCUboot geometries, building them on first use."""
+    return tuple(factory() for factory in _MCUBOOT_FACTORIES)
 
 
 @dataclass
@@ -1053,27 +1166,12 @@ def mcuboot_geometries() -> List[MCUbootGeometryEntry]:
     """
     entries: List[MCUbootGeometryEntry] = []
 
-    for config in MCUBOOT_GEOMETRIES:
+    for config in get_mcuboot_geometries():
         # Validate.
         validate_mcuboot_geometry(config)
 
         # Generate .repl content (in memory, not written to disk).
-        extra = ""
-        if config.scratch_size > 0:
-            extra = _MCUBOOT_SCRATCH_SECTION.format(
-                scratch_addr=NVM_BASE + config.scratch_offset,
-                scratch_size=config.scratch_size,
-                word_size=config.word_size,
-            )
-        repl_body = _MCUBOOT_REPL_TEMPLATE.format(
-            nvm_base=NVM_BASE,
-            nvm_size=config.nvm_size,
-            word_size=config.word_size,
-            nvm_ro_alias=NVM_BASE + config.nvm_size,
-            sram_size=config.sram_size,
-            extra_sections=extra,
-        )
-        repl_content = _build_sector_layout_comment(config) + repl_body
+        repl_content = _render_mcuboot_repl(config)
 
         # Campaign args.
         campaign_args = generate_mcuboot_campaign_args(config)
@@ -1092,257 +1190,325 @@ def mcuboot_geometries() -> List[MCUbootGeometryEntry]:
 # Standard geometry matrix
 # ---------------------------------------------------------------------------
 
-STANDARD_GEOMETRIES: List[GeometryConfig] = [
-    # (a) default -- matches current cortex_m0_nvm.repl and linker scripts.
-    #     512KB NVM, 8-byte words.
-    #     Boot: 0x0000-0x1FFF (8KB), Slot A: 0x2000 (220KB), Slot B: 0x39000 (220KB),
-    #     Metadata: 0x70000 (512 bytes for two replicas).
-    GeometryConfig(
-        nvm_size=0x80000,           # 512KB
-        word_size=8,
-        slot_a_offset=0x2000,       # 8KB boot region before slot A
-        slot_a_size=0x37000,        # 220KB
-        slot_b_offset=0x39000,
-        slot_b_size=0x37000,        # 220KB
-        metadata_offset=0x70000,
-        metadata_size=512,
-        sram_size=0x20000,          # 128KB
-        name="default",
-    ),
-    # (b) small_nvm -- 128KB NVM, 48KB slots, metadata at end.
-    GeometryConfig(
-        nvm_size=0x20000,          # 128KB
-        word_size=8,
-        slot_a_offset=0x2000,       # 8KB boot
-        slot_a_size=0xC000,         # 48KB
-        slot_b_offset=0xE000,
-        slot_b_size=0xC000,         # 48KB
-        metadata_offset=0x1A000,    # After slot B ends at 0x1A000
-        metadata_size=512,
-        sram_size=0x20000,
-        name="small_nvm",
-    ),
-    # (c) large_nvm -- 2MB NVM, 960KB slots.
-    GeometryConfig(
-        nvm_size=0x200000,         # 2MB
-        word_size=8,
-        slot_a_offset=0x4000,       # 16KB boot
-        slot_a_size=0xF0000,        # 960KB
-        slot_b_offset=0xF4000,
-        slot_b_size=0xF0000,        # 960KB
-        metadata_offset=0x1E4000,
-        metadata_size=512,
-        sram_size=0x40000,          # 256KB
-        name="large_nvm",
-    ),
-    # (d) minimal_slots -- smallest viable slots (4KB each).
-    #     Tests near-boundary behavior and off-by-one geometry math.
-    GeometryConfig(
-        nvm_size=0x20000,          # 128KB
-        word_size=8,
-        slot_a_offset=0x1000,       # 4KB boot
-        slot_a_size=0x1000,         # 4KB
-        slot_b_offset=0x2000,
-        slot_b_size=0x1000,         # 4KB
-        metadata_offset=0x3000,
-        metadata_size=512,
-        sram_size=0x10000,          # 64KB
-        name="minimal_slots",
-    ),
-    # (e) asymmetric -- Slot A = 128KB, Slot B = 64KB.
-    #     Tests size mismatch handling in copy/swap logic.
-    GeometryConfig(
-        nvm_size=0x80000,          # 512KB
-        word_size=8,
-        slot_a_offset=0x2000,       # 8KB boot
-        slot_a_size=0x20000,        # 128KB
-        slot_b_offset=0x22000,
-        slot_b_size=0x10000,        # 64KB
-        metadata_offset=0x32000,
-        metadata_size=512,
-        sram_size=0x20000,
-        name="asymmetric",
-    ),
-    # (f) tight_metadata -- metadata immediately after slot B with no gap.
-    #     Tests boundary arithmetic when there's zero padding between
-    #     the staging area and metadata.
-    GeometryConfig(
-        nvm_size=0x80000,          # 512KB
-        word_size=8,
-        slot_a_offset=0x2000,
-        slot_a_size=0x37000,        # 220KB
-        slot_b_offset=0x39000,
-        slot_b_size=0x37000,        # 220KB
-        metadata_offset=0x70000,    # Immediately after slot B (0x39000 + 0x37000 = 0x70000)
-        metadata_size=256,          # Single replica, minimum viable
-        sram_size=0x20000,
-        name="tight_metadata",
-    ),
-    # (g) word_size_4 -- 4-byte word size instead of 8.
-    #     Tests that write-granularity assumptions aren't hardcoded to 8.
-    GeometryConfig(
-        nvm_size=0x80000,          # 512KB
-        word_size=4,
-        slot_a_offset=0x2000,
-        slot_a_size=0x37000,
-        slot_b_offset=0x39000,
-        slot_b_size=0x37000,
-        metadata_offset=0x70000,
-        metadata_size=512,
-        sram_size=0x20000,
-        name="word_size_4",
-    ),
-    # (h) max_slots -- slots consume nearly all available NVM.
-    #     Boot = 4KB, two equal slots filling the rest minus 512 bytes metadata.
-    #     512KB total: 4KB boot + 2 * 254.75KB slots + 512B metadata.
-    #     slot_size = (0x80000 - 0x1000 - 0x200) // 2 = 0x3F700, rounded down to
-    #     8-byte alignment = 0x3F700 (259840 bytes each).
-    GeometryConfig(
-        nvm_size=0x80000,          # 512KB
-        word_size=8,
-        slot_a_offset=0x1000,       # 4KB boot
-        slot_a_size=0x3F600,        # ~253.5KB
-        slot_b_offset=0x40600,
-        slot_b_size=0x3F600,        # ~253.5KB
-        metadata_offset=0x7FC00,    # Near end of NVM
-        metadata_size=512,          # 0x200
-        sram_size=0x20000,
-        name="max_slots",
-    ),
-]
+@functools.lru_cache(maxsize=None)
+def get_standard_geometries() -> Tuple[GeometryConfig, ...]:
+    """Return the standard geometries, building them on first use."""
+    return (
+        # (a) default -- matches current cortex_m0_nvm.repl and linker scripts.
+        #     512KB NVM, 8-byte words.
+        #     Boot: 0x0000-0x1FFF (8KB), Slot A: 0x2000 (220KB), Slot B: 0x39000 (220KB),
+        #     Metadata: 0x70000 (512 bytes for two replicas).
+        GeometryConfig(
+            nvm_size=0x80000,           # 512KB
+            word_size=8,
+            slot_a_offset=0x2000,       # 8KB boot region before slot A
+            slot_a_size=0x37000,        # 220KB
+            slot_b_offset=0x39000,
+            slot_b_size=0x37000,        # 220KB
+            metadata_offset=0x70000,
+            metadata_size=512,
+            sram_size=0x20000,          # 128KB
+            name="default",
+        ),
+        # (b) small_nvm -- 128KB NVM, 48KB slots, metadata at end.
+        GeometryConfig(
+            nvm_size=0x20000,          # 128KB
+            word_size=8,
+            slot_a_offset=0x2000,       # 8KB boot
+            slot_a_size=0xC000,         # 48KB
+            slot_b_offset=0xE000,
+            slot_b_size=0xC000,         # 48KB
+            metadata_offset=0x1A000,    # After slot B ends at 0x1A000
+            metadata_size=512,
+            sram_size=0x20000,
+            name="small_nvm",
+        ),
+        # (c) large_nvm -- 2MB NVM, 960KB slots.
+        GeometryConfig(
+            nvm_size=0x200000,         # 2MB
+            word_size=8,
+            slot_a_offset=0x4000,       # 16KB boot
+            slot_a_size=0xF0000,        # 960KB
+            slot_b_offset=0xF4000,
+            slot_b_size=0xF0000,        # 960KB
+            metadata_offset=0x1E4000,
+            metadata_size=512,
+            sram_size=0x40000,          # 256KB
+            name="large_nvm",
+        ),
+        # (d) minimal_slots -- smallest viable slots (4KB each).
+        #     Tests near-boundary behavior and off-by-one geometry math.
+        GeometryConfig(
+            nvm_size=0x20000,          # 128KB
+            word_size=8,
+            slot_a_offset=0x1000,       # 4KB boot
+            slot_a_size=0x1000,         # 4KB
+            slot_b_offset=0x2000,
+            slot_b_size=0x1000,         # 4KB
+            metadata_offset=0x3000,
+            metadata_size=512,
+            sram_size=0x10000,          # 64KB
+            name="minimal_slots",
+        ),
+        # (e) asymmetric -- Slot A = 128KB, Slot B = 64KB.
+        #     Tests size mismatch handling in copy/swap logic.
+        GeometryConfig(
+            nvm_size=0x80000,          # 512KB
+            word_size=8,
+            slot_a_offset=0x2000,       # 8KB boot
+            slot_a_size=0x20000,        # 128KB
+            slot_b_offset=0x22000,
+            slot_b_size=0x10000,        # 64KB
+            metadata_offset=0x32000,
+            metadata_size=512,
+            sram_size=0x20000,
+            name="asymmetric",
+        ),
+        # (f) tight_metadata -- metadata immediately after slot B with no gap.
+        #     Tests boundary arithmetic when there's zero padding between
+        #     the staging area and metadata.
+        GeometryConfig(
+            nvm_size=0x80000,          # 512KB
+            word_size=8,
+            slot_a_offset=0x2000,
+            slot_a_size=0x37000,        # 220KB
+            slot_b_offset=0x39000,
+            slot_b_size=0x37000,        # 220KB
+            metadata_offset=0x70000,    # Immediately after slot B (0x39000 + 0x37000 = 0x70000)
+            metadata_size=256,          # Single replica, minimum viable
+            sram_size=0x20000,
+            name="tight_metadata",
+        ),
+        # (g) word_size_4 -- 4-byte word size instead of 8.
+        #     Tests that write-granularity assumptions aren't hardcoded to 8.
+        GeometryConfig(
+            nvm_size=0x80000,          # 512KB
+            word_size=4,
+            slot_a_offset=0x2000,
+            slot_a_size=0x37000,
+            slot_b_offset=0x39000,
+            slot_b_size=0x37000,
+            metadata_offset=0x70000,
+            metadata_size=512,
+            sram_size=0x20000,
+            name="word_size_4",
+        ),
+        # (h) max_slots -- slots consume nearly all available NVM.
+        #     Boot = 4KB, two equal slots filling the rest minus 512 bytes metadata.
+        #     512KB total: 4KB boot + 2 * 254.75KB slots + 512B metadata.
+        #     slot_size = (0x80000 - 0x1000 - 0x200) // 2 = 0x3F700, rounded down to
+        #     8-byte alignment = 0x3F700 (259840 bytes each).
+        GeometryConfig(
+            nvm_size=0x80000,          # 512KB
+            word_size=8,
+            slot_a_offset=0x1000,       # 4KB boot
+            slot_a_size=0x3F600,        # ~253.5KB
+            slot_b_offset=0x40600,
+            slot_b_size=0x3F600,        # ~253.5KB
+            metadata_offset=0x7FC00,    # Near end of NVM
+            metadata_size=512,          # 0x200
+            sram_size=0x20000,
+            name="max_slots",
+        ),
+    )
+
 
-# Name-indexed lookup (includes both standard and MCUboot geometries).
-GEOMETRIES_BY_NAME: Dict[str, GeometryConfig] = {g.name: g for g in STANDARD_GEOMETRIES}
-GEOMETRIES_BY_NAME.update({g.name: g for g in MCUBOOT_GEOMETRIES})
+@functools.lru_cache(maxsize=None)
+def get_geometries_by_name() -> Dict[str, GeometryConfig]:
+    """Return a name-indexed lookup of both standard and MCUboot geometries."""
+    by_name: Dict[str, GeometryConfig] = {g.name: g for g in get_standard_geometries()}
+    by_name.update({g.name: g for g in get_mcuboot_geometries()})
+    return by_name
 
-# Combined list for --mode all.
-ALL_GEOMETRIES: List[GeometryConfig] = list(STANDARD_GEOMETRIES) + list(MCUBOOT_GEOMETRIES)
+
+# Builders for the module-level geometry collections.  Each is built on first
+# access and then stored in the module namespace, so every later access
+# returns the same (mutable) object, as it did when these were constants.
+_LAZY_COLLECTIONS: Dict[str, Callable[[], Any]] = {
+    "STANDARD_GEOMETRIES": lambda: list(get_standard_geometries()),
+    "MCUBOOT_GEOMETRIES": lambda: list(get_mcuboot_geometries()),
+    "MCUBOOT_GEOMETRIES_BY_NAME": lambda: {g.name: g for g in get_mcuboot_geometries()},
+    "GEOMETRIES_BY_NAME": lambda: dict(get_geometries_by_name()),
+    "ALL_GEOMETRIES": lambda: list(get_standard_geometries()) + list(get_mcuboot_geometries()),
+}
+
+
+def __getattr__(name: str) -> Any:
+    builder = _LAZY_COLLECTIONS.get(name)
+    if builder is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = globals()[name] = builder()
+    return value
 
 
 # ---------------------------------------------------------------------------
 # Full matrix generation
 # ---------------------------------------------------------------------------
 
+def _sector_map_to_list(sectors: Sequence[SectorRange]) -> List[Dict[str, Any]]:
+    """Serialize a sector map for the manifest."""
+    return [{"count": s.count, "size": s.size, "size_hex": f"0x{s.size:X}"} for s in sectors]
+
+
 def _config_to_dict(config: GeometryConfig) -> Dict[str, Any]:
     """Serialize a GeometryConfig to a JSON-friendly dict with hex strings."""
     d: Dict[str, Any] = {
         "name": config.name,
         "nvm_size": config.nvm_size,
-        "nvm_size_hex": "0x{:X}".format(config.nvm_size),
+        "nvm_size_hex": f"0x{config.nvm_size:X}",
         "word_size": config.word_size,
         "slot_a_offset": config.slot_a_offset,
-        "slot_a_offset_hex": "0x{:X}".format(config.slot_a_offset),
+        "slot_a_offset_hex": f"0x{config.slot_a_offset:X}",
         "slot_a_size": config.slot_a_size,
-        "slot_a_size_hex": "0x{:X}".format(config.slot_a_size),
-        "slot_a_addr": NVM_BASE + config.slot_a_offset,
-        "slot_a_addr_hex": "0x{:08X}".format(NVM_BASE + config.slot_a_offset),
+        "slot_a_size_hex": f"0x{config.slot_a_size:X}",
+        "slot_a_addr": config.slot_a_addr,
+        "slot_a_addr_hex": f"0x{config.slot_a_addr:08X}",
         "slot_b_offset": config.slot_b_offset,
-        "slot_b_offset_hex": "0x{:X}".format(config.slot_b_offset),
+        "slot_b_offset_hex": f"0x{config.slot_b_offset:X}",
         "slot_b_size": config.slot_b_size,
-        "slot_b_size_hex": "0x{:X}".format(config.slot_b_size),
-        "slot_b_addr": NVM_BASE + config.slot_b_offset,
-        "slot_b_addr_hex": "0x{:08X}".format(NVM_BASE + config.slot_b_offset),
+        "slot_b_size_hex": f"0x{config.slot_b_size:X}",
+        "slot_b_addr": config.slot_b_addr,
+        "slot_b_addr_hex": f"0x{config.slot_b_addr:08X}",
         "metadata_offset": config.metadata_offset,
-        "metadata_offset_hex": "0x{:X}".format(config.metadata_offset),
+        "metadata_offset_hex": f"0x{config.metadata_offset:X}",
         "metadata_size": config.metadata_size,
         "sram_size": config.sram_size,
-        "sram_size_hex": "0x{:X}".format(config.sram_size),
+        "sram_size_hex": f"0x{config.sram_size:X}",
     }
 
     # Add MCUboot-specific fields if present.
     if isinstance(config, MCUbootGeometryConfig):
-        d["sector_size"] = config.sector_size
-        d["sector_size_hex"] = "0x{:X}".format(config.sector_size)
-        d["trailer_size"] = config.trailer_size
-        d["write_alignment"] = config.write_alignment
-        d["bug_class"] = config.bug_class
+        d.update({
+            "sector_size": config.sector_size,
+            "sector_size_hex": f"0x{config.sector_size:X}",
+            "trailer_size": config.trailer_size,
+            "write_alignment": config.write_alignment,
+            "bug_class": config.bug_class,
+        })
         if config.scratch_size > 0:
-            d["scratch_offset"] = config.scratch_offset
-            d["scratch_offset_hex"] = "0x{:X}".format(config.scratch_offset)
-            d["scratch_size"] = config.scratch_size
-            d["scratch_size_hex"] = "0x{:X}".format(config.scratch_size)
-            d["scratch_addr"] = NVM_BASE + config.scratch_offset
-            d["scratch_addr_hex"] = "0x{:08X}".format(NVM_BASE + config.scratch_offset)
+            d.update({
+                "scratch_offset": config.scratch_offset,
+                "scratch_offset_hex": f"0x{config.scratch_offset:X}",
+                "scratch_size": config.scratch_size,
+                "scratch_size_hex": f"0x{config.scratch_size:X}",
+                "scratch_addr": config.scratch_addr,
+                "scratch_addr_hex": f"0x{config.scratch_addr:08X}",
+            })
         if config.slot_a_sectors:
-            d["slot_a_sectors"] = [
-                {"count": s.count, "size": s.size, "size_hex": "0x{:X}".format(s.size)}
-                for s in config.slot_a_sectors
-            ]
+            d["slot_a_sectors"] = _sector_map_to_list(config.slot_a_sectors)
         if config.slot_b_sectors:
-            d["slot_b_sectors"] = [
-                {"count": s.count, "size": s.size, "size_hex": "0x{:X}".format(s.size)}
-                for s in config.slot_b_sectors
-            ]
+            d["slot_b_sectors"] = _sector_map_to_list(config.slot_b_sectors)
         total_writes = config.slot_a_size // config.word_size
         d["total_writes"] = total_writes
         d["write_granularity"] = config.word_size
-        d["fault_range"] = "0:{}".format(total_writes)
+        d["fault_range"] = f"0:{total_writes}"
 
     return d
 
 
+def _validate_config(config: GeometryConfig) -> None:
+    """Run the validator matching the config's type."""
+    if isinstance(config, MCUbootGeometryConfig):
+        validate_mcuboot_geometry(config)
+    else:
+        validate_geometry(config)
+
+
+def _emit_geometry(
+    config: GeometryConfig, output_dir: Path, write: Optional[FileWriter] = None
+) -> Dict[str, Any]:
+    """Write one (already validated) geometry's artifacts and return its manifest entry.
+
+    Files go to disk under ``output_dir`` unless ``write`` is given.
+    """
+    is_mcuboot = isinstance(config, MCUbootGeometryConfig)
+
+    geo_dir = output_dir / config.name
+    if write is None:
+        geo_dir.mkdir(parents=True, exist_ok=True)
+        write = _write_file
+
+    # Platform .repl -- use MCUboot-specific template when applicable.
+    if is_mcuboot:
+        repl_path = generate_mcuboot_platform_repl(config, geo_dir / "platform.repl", write)
+    else:
+        repl_path = generate_platform_repl(config, geo_dir / "platform.repl", write)
+
+    # Linker scripts
+    linker_paths = generate_linker_scripts(config, geo_dir, write)
+
+    # Boot metadata generator
+    meta_script_path = generate_boot_meta_script(config, geo_dir / "gen_boot_meta.py", write)
+    meta_bin_path = generate_boot_meta_bin(config, geo_dir / "boot_meta.bin", write)
+
+    # Campaign args -- MCUboot configs get extra parameters.
+    if is_mcuboot:
+        campaign_args = generate_mcuboot_campaign_args(config)
+    else:
+        campaign_args = generate_campaign_args(config)
+    args_path = geo_dir / "campaign_args.txt"
+    write(args_path, " \\\n    ".join(campaign_args) + "\n")
+
+    entry: Dict[str, Any] = _config_to_dict(config)
+    entry["files"] = {
+        "platform_repl": str(repl_path),
+        "gen_boot_meta": str(meta_script_path),
+        "boot_meta_bin": str(meta_bin_path),
+        "campaign_args": str(args_path),
+        "linker_boot": str(linker_paths["boot"]) if "boot" in linker_paths else None,
+        "linker_slot_a": str(linker_paths["slot_a"]),
+        "linker_slot_b": str(linker_paths["slot_b"]),
+    }
+    entry["campaign_args_list"] = campaign_args
+    return entry
+
+
 def generate_matrix(
     output_dir: Path,
     geometries: Optional[List[GeometryConfig]] = None,
+    jobs: int = 1,
+    write: Optional[FileWriter] = None,
+    already_validated: bool = False,
 ) -> Dict[str, Any]:
     """Generate all artifacts for a set of geometries.
 
     Creates per-geometry subdirectories under output_dir, each containing:
         - platform.repl
         - linker_boot.ld, linker_slot_a.ld, linker_slot_b.ld
-        - gen_boot_meta.py
+        - gen_boot_meta.py, boot_meta.bin
         - campaign_args.txt
 
-    Returns a manifest dict suitable for JSON serialization.
-    """
-    if geometries is None:
-        geometries = STANDARD_GEOMETRIES
+    With ``jobs > 1`` geometries are generated in a thread pool (the work is
+    dominated by file-system syscalls, which release the GIL); manifest
+    order always follows ``geometries``.
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    manifest_entries: List[Dict[str, Any]] = []
+    When ``write`` is given (e.g. a ``_tar_writer``), every file including
+    the manifest is handed to it instead of being written under output_dir;
+    generation is then always serial.
 
-    for config in geometries:
-        is_mcuboot = isinstance(config, MCUbootGeometryConfig)
+    Every geometry is validated before anything is written unless the
+    caller passes ``already_validated=True``.
 
-        if is_mcuboot:
-            validate_mcuboot_geometry(config)
-        else:
-            validate_geometry(config)
-
-        geo_dir = output_dir / config.name
-        geo_dir.mkdir(parents=True, exist_ok=True)
-
-        # Platform .repl -- use MCUboot-specific template when applicable.
-        if is_mcuboot:
-            repl_path = generate_mcuboot_platform_repl(config, geo_dir / "platform.repl")
-        else:
-            repl_path = generate_platform_repl(config, geo_dir / "platform.repl")
-
-        # Linker scripts
-        linker_paths = generate_linker_scripts(config, geo_dir)
-
-        # Boot metadata generator
-        meta_script_path = generate_boot_meta_script(config, geo_dir / "gen_boot_meta.py")
-
-        # Campaign args -- MCUboot configs get extra parameters.
-        if is_mcuboot:
-            campaign_args = generate_mcuboot_campaign_args(config)
-        else:
-            campaign_args = generate_campaign_args(config)
-        args_path = geo_dir / "campaign_args.txt"
-        args_path.write_text(" \\\n    ".join(campaign_args) + "\n", encoding="utf-8")
-
-        entry: Dict[str, Any] = _config_to_dict(config)
-        entry["files"] = {
-            "platform_repl": str(repl_path),
-            "gen_boot_meta": str(meta_script_path),
-            "campaign_args": str(args_path),
-            "linker_boot": str(linker_paths["boot"]) if "boot" in linker_paths else None,
-            "linker_slot_a": str(linker_paths["slot_a"]),
-            "linker_slot_b": str(linker_paths["slot_b"]),
-        }
-        entry["campaign_args_list"] = campaign_args
-        manifest_entries.append(entry)
+    Returns a manifest dict suitable for JSON serialization.
+    """
+    if geometries is None:
+        geometries = list(get_standard_geometries())
+
+    if not already_validated:
+        for config in geometries:
+            _validate_config(config)
+
+    if write is not None:
+        manifest_entries = [_emit_geometry(config, output_dir, write) for config in geometries]
+    elif jobs > 1 and len(geometries) > 1:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(jobs, len(geometries))) as pool:
+            manifest_entries = list(
+                pool.map(_emit_geometry, geometries, itertools.repeat(output_dir))
+            )
+    else:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_entries = [_emit_geometry(config, output_dir) for config in geometries]
 
     manifest: Dict[str, Any] = {
         "nvm_base": NVM_BASE,
@@ -1352,10 +1518,14 @@ def generate_matrix(
     }
 
     manifest_path = output_dir / "manifest.json"
-    manifest_path.write_text(
-        json.dumps(manifest, indent=2, sort_keys=False) + "\n",
-        encoding="utf-8",
-    )
+    if write is not None:
+        write(manifest_path, json.dumps(manifest, indent=2, sort_keys=False) + "\n")
+    else:
+        # Stream the encoder's chunks through the file buffer rather than
+        # building the whole document as one string first.
+        with manifest_path.open("w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, indent=2, sort_keys=False)
+            fp.write("\n")
 
     return manifest
 
@@ -1364,54 +1534,56 @@ def generate_matrix(
 # CLI
 # ---------------------------------------------------------------------------
 
-def _print_geometry_list(geometries: List[GeometryConfig], header: str = "") -> None:
-    """Print a formatted listing of geometries to stdout."""
-    if header:
-        print(header)
+def _print_geometry_list(geometries: Sequence[GeometryConfig], header: str = "") -> None:
+    """Print a formatted listing of geometries to stdout in a single write."""
+    lines: List[str] = [header] if header else []
     for g in geometries:
-        base_info = "{:<40s}  NVM={:>7s}  word={}  slotA={:>7s}  slotB={:>7s}  meta@0x{:X}".format(
-            g.name,
-            "{}KB".format(g.nvm_size // 1024),
-            g.word_size,
-            "{}KB".format(g.slot_a_size // 1024),
-            "{}KB".format(g.slot_b_size // 1024),
-            g.metadata_offset,
+        lines.append(
+            f"{g.name:<40s}  NVM={g.nvm_size // 1024:>5d}KB  word={g.word_size}  "
+            f"slotA={g.slot_a_size // 1024:>5d}KB  slotB={g.slot_b_size // 1024:>5d}KB  "
+            f"meta@0x{g.metadata_offset:X}"
         )
-        print(base_info)
         if isinstance(g, MCUbootGeometryConfig):
-            extras: List[str] = []
-            extras.append("sector=0x{:X}".format(g.sector_size))
-            extras.append("trailer={}B".format(g.trailer_size))
+            extras = [f"sector=0x{g.sector_size:X}", f"trailer={g.trailer_size}B"]
             if g.scratch_size > 0:
-                extras.append("scratch={}KB".format(g.scratch_size // 1024))
+                extras.append(f"scratch={g.scratch_size // 1024}KB")
             if g.slot_a_sectors:
-                sector_desc = "+".join(
-                    "{}x{}KB".format(s.count, s.size // 1024) for s in g.slot_a_sectors
-                )
-                extras.append("sectors=[{}]".format(sector_desc))
-            print("  {}".format("  ".join(extras)))
+                sector_desc = "+".join(f"{s.count}x{s.size // 1024}KB" for s in g.slot_a_sectors)
+                extras.append(f"sectors=[{sector_desc}]")
+            lines.append("  " + "  ".join(extras))
             if g.bug_class:
                 # Print first sentence of bug_class as a one-liner.
-                first_sentence = g.bug_class.split(".")[0].strip()
-                print("  -> {}".format(first_sentence))
+                lines.append("  -> " + g.bug_class.partition(".")[0].strip())
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate OTA geometry matrix: platform files, linker scripts, and campaign args."
     )
-    parser.add_argument(
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
         "--output-dir",
         type=Path,
         help="Directory to write generated artifacts into.",
     )
+    output.add_argument(
+        "--output-tar",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Stream all generated artifacts into an uncompressed tar archive "
+            "instead of a directory tree (paths are relative to the archive root)."
+        ),
+    )
     parser.add_argument(
         "--geometry",
         nargs="*",
         metavar="NAME",
         help=(
             "One or more geometry names to generate (default: depends on --mode). "
-            "Available: {}".format(", ".join(sorted(GEOMETRIES_BY_NAME.keys())))
+            "Use --list to see the available names."
         ),
     )
     parser.add_argument(
@@ -1435,54 +1607,55 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Validate geometries without generating files.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of geometries to generate in parallel (default: 1).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     args = parse_args(argv)
 
-    # Resolve the base geometry set from --mode.
-    if args.mode == "mcuboot":
-        base_geometries: List[GeometryConfig] = list(MCUBOOT_GEOMETRIES)
-    elif args.mode == "all":
-        base_geometries = list(ALL_GEOMETRIES)
-    else:
-        base_geometries = list(STANDARD_GEOMETRIES)
-
+    # Listing only reads the module-level configs: no copies, validation, or I/O.
     if args.list_geometries:
         if args.mode == "all":
-            _print_geometry_list(STANDARD_GEOMETRIES, "=== Standard geometries ===")
+            _print_geometry_list(get_standard_geometries(), "=== Standard geometries ===")
             print()
-            _print_geometry_list(MCUBOOT_GEOMETRIES, "=== MCUboot geometries ===")
+            _print_geometry_list(get_mcuboot_geometries(), "=== MCUboot geometries ===")
         elif args.mode == "mcuboot":
-            _print_geometry_list(MCUBOOT_GEOMETRIES, "=== MCUboot geometries ===")
+            _print_geometry_list(get_mcuboot_geometries(), "=== MCUboot geometries ===")
         else:
-            _print_geometry_list(STANDARD_GEOMETRIES, "=== Standard geometries ===")
+            _print_geometry_list(get_standard_geometries(), "=== Standard geometries ===")
         return 0
 
     # Resolve which geometries to use.
     if args.geometry:
+        by_name = get_geometries_by_name()
         selected: List[GeometryConfig] = []
         for name in args.geometry:
-            if name not in GEOMETRIES_BY_NAME:
+            if name not in by_name:
                 print(
                     "Unknown geometry '{}'. Available: {}".format(
-                        name, ", ".join(GEOMETRIES_BY_NAME.keys())
+                        name, ", ".join(by_name.keys())
                     ),
                     file=sys.stderr,
                 )
                 return 1
-            selected.append(GEOMETRIES_BY_NAME[name])
+            selected.append(by_name[name])
+    elif args.mode == "mcuboot":
+        selected = list(get_mcuboot_geometries())
+    elif args.mode == "all":
+        selected = list(get_standard_geometries()) + list(get_mcuboot_geometries())
     else:
-        selected = base_geometries
+        selected = list(get_standard_geometries())
 
     # Validate all selected geometries.
     for config in selected:
         try:
-            if isinstance(config, MCUbootGeometryConfig):
-                validate_mcuboot_geometry(config)
-            else:
-                validate_geometry(config)
+            _validate_config(config)
         except ValueError as exc:
             print("Validation error: {}".format(exc), file=sys.stderr)
             return 1
@@ -1491,11 +1664,28 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("All {} geometries valid.".format(len(selected)))
         return 0
 
+    if args.output_tar is not None:
+        with tarfile.open(args.output_tar, mode="w|") as tar:
+            manifest = generate_matrix(
+                Path(), geometries=selected, write=_tar_writer(tar), already_validated=True
+            )
+        print(
+            "Generated {} geometries in {}".format(
+                manifest["geometry_count"], args.output_tar
+            )
+        )
+        return 0
+
     if args.output_dir is None:
-        print("--output-dir is required (unless using --list or --validate-only).", file=sys.stderr)
+        print(
+            "--output-dir or --output-tar is required (unless using --list or --validate-only).",
+            file=sys.stderr,
+        )
         return 1
 
-    manifest = generate_matrix(args.output_dir, geometries=selected)
+    manifest = generate_matrix(
+        args.output_dir, geometries=selected, jobs=args.jobs, already_validated=True
+    )
     print(
         "Generated {} geometries in {}".format(
             manifest["geometry_count"], args.output_dir
@@ -19,6 +19,10 @@ Usage from a campaign runner::
 
 from __future__ import annotations
 
+import functools
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fault_inject import FaultResult
@@ -29,7 +33,7 @@ from fault_inject import FaultResult
 # ---------------------------------------------------------------------------
 
 class InvariantViolation(Exception):
-    """Raised (or collected) when a postcondition invariant is violated.
+    """Returned (or raised) by a check when a postcondition invariant is violated.
 
     Attributes:
         invariant_name: Machine-readable name of the invariant that failed.
@@ -51,11 +55,60 @@ class InvariantViolation(Exception):
         self.details = details or {}
         super().__init__(f"{invariant_name}: {description}")
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Exception pickling replays self.args (the message only); rebuild
+        # from the real fields so violations survive process boundaries.
+        return (
+            type(self),
+            (self.invariant_name, self.description, self.result, self.details),
+        )
+
 
 # Type alias for an invariant check function.  Every check takes a
 # FaultResult as its first positional argument and arbitrary keyword
-# context (pre_state, write_log, partition_ranges, etc.).
-InvariantFn = Callable[..., None]
+# context (pre_state, write_log, partition_ranges, etc.), and returns an
+# InvariantViolation on failure or None on success.  Raising the violation
+# instead is still accepted from custom checks; any other return value
+# (e.g. a legacy check returning a status) is ignored.
+InvariantFn = Callable[..., Optional[InvariantViolation]]
+
+
+# ---------------------------------------------------------------------------
+# nvm_state normalization
+# ---------------------------------------------------------------------------
+
+def _normalize_nvm(nvm: Any) -> Optional[Dict[str, Any]]:
+    """Flatten a result's ``nvm_state`` into the canonical keys the checks read.
+
+    Legacy key fallbacks (``active_slot``, ``slot_a_valid``/``slot_b_valid``)
+    are resolved here once.  Returns ``None`` when ``nvm_state`` is not a dict.
+    """
+    if not isinstance(nvm, dict):
+        return None
+    get = nvm.get
+    return {
+        "requested_slot": get("requested_slot") or get("active_slot"),
+        "chosen_slot": get("chosen_slot"),
+        "slot_a_valid": get("replica0_valid", get("slot_a_valid")),
+        "slot_b_valid": get("replica1_valid", get("slot_b_valid")),
+        "replica0_valid": get("replica0_valid"),
+        "replica1_valid": get("replica1_valid"),
+        "replica0_seq": get("replica0_seq"),
+        "replica1_seq": get("replica1_seq"),
+        "initial_sp": get("initial_sp"),
+        "reset_vector": get("reset_vector"),
+        "slot_start": get("slot_start"),
+        "slot_end": get("slot_end"),
+    }
+
+
+def _nvm_view(
+    result: FaultResult, normalized_nvm: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Return the runner's normalized nvm_state, normalizing on direct calls."""
+    if normalized_nvm is not None:
+        return normalized_nvm
+    return _normalize_nvm(result.nvm_state)
 
 
 # ---------------------------------------------------------------------------
@@ -66,7 +119,7 @@ def check_at_least_one_bootable(
     result: FaultResult,
     pre_state: Optional[Dict[str, Any]] = None,
     **_: Any,
-) -> None:
+) -> Optional[InvariantViolation]:
     """If the pre-fault state had at least one valid slot, the device must boot.
 
     A single fault should never brick *both* slots when one was not being
@@ -74,7 +127,7 @@ def check_at_least_one_bootable(
     cannot reason about the precondition without it).
     """
     if pre_state is None:
-        return
+        return None
 
     # Determine whether the pre-state had at least one valid slot.
     # IMPORTANT: use slot_a_valid/slot_b_valid (vector table checks), NOT
@@ -85,10 +138,10 @@ def check_at_least_one_bootable(
 
     if not (pre_slot_a_valid or pre_slot_b_valid):
         # Pre-state already had no valid slots — nothing to assert.
-        return
+        return None
 
     if result.boot_outcome != "success":
-        raise InvariantViolation(
+        return InvariantViolation(
             invariant_name="at_least_one_bootable",
             description=(
                 "Device failed to boot (outcome={!r}) after a single fault, "
@@ -105,37 +158,42 @@ def check_at_least_one_bootable(
                 "fault_at": result.fault_at,
             },
         )
+    return None
 
 
-def check_boot_matches_metadata(result: FaultResult, **_: Any) -> None:
+def check_boot_matches_metadata(
+    result: FaultResult,
+    normalized_nvm: Optional[Dict[str, Any]] = None,
+    **_: Any,
+) -> Optional[InvariantViolation]:
     """If metadata says active slot is X and both slots are valid, boot must go to X.
 
     Only applicable when ``nvm_state`` provides ``requested_slot`` and
     ``chosen_slot`` (or ``active_slot``) together with per-slot validity.
     """
-    nvm = result.nvm_state
-    if not isinstance(nvm, dict):
-        return
+    nvm = _nvm_view(result, normalized_nvm)
+    if nvm is None:
+        return None
 
-    requested = nvm.get("requested_slot") or nvm.get("active_slot")
-    chosen = nvm.get("chosen_slot")
+    requested = nvm["requested_slot"]
+    chosen = nvm["chosen_slot"]
     if requested is None or chosen is None:
-        return
+        return None
 
-    slot_a_valid = nvm.get("replica0_valid", nvm.get("slot_a_valid"))
-    slot_b_valid = nvm.get("replica1_valid", nvm.get("slot_b_valid"))
+    slot_a_valid = nvm["slot_a_valid"]
+    slot_b_valid = nvm["slot_b_valid"]
 
     # Only meaningful when both slots are valid — if one is corrupt the
     # bootloader is free to fall back.
     if not (slot_a_valid and slot_b_valid):
-        return
+        return None
 
     if result.boot_outcome != "success":
         # Boot failed entirely — check_at_least_one_bootable covers that.
-        return
+        return None
 
     if chosen != requested:
-        raise InvariantViolation(
+        return InvariantViolation(
             invariant_name="boot_matches_metadata",
             description=(
                 "Metadata requested slot {!r} but bootloader chose slot {!r} "
@@ -151,9 +209,14 @@ def check_boot_matches_metadata(result: FaultResult, **_: Any) -> None:
                 "slot_b_valid": slot_b_valid,
             },
         )
+    return None
 
 
-def check_metadata_single_fault_consistency(result: FaultResult, **_: Any) -> None:
+def check_metadata_single_fault_consistency(
+    result: FaultResult,
+    normalized_nvm: Optional[Dict[str, Any]] = None,
+    **_: Any,
+) -> Optional[InvariantViolation]:
     """After a single fault at least one metadata replica must remain valid.
 
     If both replicas are invalid after one fault the update protocol has a
@@ -163,21 +226,21 @@ def check_metadata_single_fault_consistency(result: FaultResult, **_: Any) -> No
     Only checked for non-control runs (control runs have no fault).
     """
     if result.is_control:
-        return
+        return None
 
-    nvm = result.nvm_state
-    if not isinstance(nvm, dict):
-        return
+    nvm = _nvm_view(result, normalized_nvm)
+    if nvm is None:
+        return None
 
-    replica0_valid = nvm.get("replica0_valid")
-    replica1_valid = nvm.get("replica1_valid")
+    replica0_valid = nvm["replica0_valid"]
+    replica1_valid = nvm["replica1_valid"]
 
     # Skip if the state dict doesn't carry replica validity.
     if replica0_valid is None or replica1_valid is None:
-        return
+        return None
 
     if not replica0_valid and not replica1_valid:
-        raise InvariantViolation(
+        return InvariantViolation(
             invariant_name="metadata_single_fault_consistency",
             description=(
                 "Both metadata replicas are invalid after a single fault "
@@ -190,11 +253,35 @@ def check_metadata_single_fault_consistency(result: FaultResult, **_: Any) -> No
             details={
                 "replica0_valid": replica0_valid,
                 "replica1_valid": replica1_valid,
-                "replica0_seq": nvm.get("replica0_seq"),
-                "replica1_seq": nvm.get("replica1_seq"),
+                "replica0_seq": nvm["replica0_seq"],
+                "replica1_seq": nvm["replica1_seq"],
                 "fault_at": result.fault_at,
             },
         )
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_ranges(
+    ranges: Tuple[Tuple[int, int], ...],
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Merge half-open ranges into sorted, disjoint ``(starts, ends)`` tuples.
+
+    Empty ranges are dropped; overlapping or touching ranges are coalesced.
+    Cached, since a campaign passes the same partition ranges for every run.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return tuple(starts), tuple(ends)
 
 
 def check_no_oob_writes(
@@ -202,7 +289,7 @@ def check_no_oob_writes(
     write_log: Optional[List[int]] = None,
     partition_ranges: Optional[List[Tuple[int, int]]] = None,
     **_: Any,
-) -> None:
+) -> Optional[InvariantViolation]:
     """Flag any NVM write outside the allowed partition ranges.
 
     Parameters:
@@ -213,18 +300,21 @@ def check_no_oob_writes(
     Skipped when either argument is ``None``.
     """
     if write_log is None or partition_ranges is None:
-        return
+        return None
 
     if not partition_ranges:
-        return
+        return None
 
+    # One binary search per address instead of a scan over every range.
+    starts, ends = _merge_ranges(tuple((start, end) for start, end in partition_ranges))
     oob_addresses: List[int] = []
     for addr in write_log:
-        if not any(start <= addr < end for start, end in partition_ranges):
+        i = bisect_right(starts, addr) - 1
+        if i < 0 or addr >= ends[i]:
             oob_addresses.append(addr)
 
     if oob_addresses:
-        raise InvariantViolation(
+        return InvariantViolation(
             invariant_name="no_oob_writes",
             description=(
                 "{} write(s) landed outside allowed partition ranges. "
@@ -240,6 +330,7 @@ def check_no_oob_writes(
                 ],
             },
         )
+    return None
 
 
 # SRAM range for Cortex-M0+ vector table validation.
@@ -247,7 +338,11 @@ _SRAM_START = 0x20000000
 _SRAM_END = 0x20100000  # 1 MB — generous upper bound.
 
 
-def check_slot_integrity(result: FaultResult, **_: Any) -> None:
+def check_slot_integrity(
+    result: FaultResult,
+    normalized_nvm: Optional[Dict[str, Any]] = None,
+    **_: Any,
+) -> Optional[InvariantViolation]:
     """If boot succeeded, the chosen slot must have plausible ARM vectors.
 
     Validates (when derivable from nvm_state):
@@ -256,20 +351,32 @@ def check_slot_integrity(result: FaultResult, **_: Any) -> None:
       - Reset vector has the Thumb bit set (bit 0 = 1).
     """
     if result.boot_outcome != "success":
-        return
+        return None
 
-    nvm = result.nvm_state
-    if not isinstance(nvm, dict):
-        return
+    nvm = _nvm_view(result, normalized_nvm)
+    if nvm is None:
+        return None
 
-    initial_sp = nvm.get("initial_sp")
-    reset_vector = nvm.get("reset_vector")
-    slot_start = nvm.get("slot_start")
-    slot_end = nvm.get("slot_end")
+    initial_sp = nvm["initial_sp"]
+    reset_vector = nvm["reset_vector"]
+    slot_start = nvm["slot_start"]
+    slot_end = nvm["slot_end"]
 
     # Nothing to validate if the state doesn't carry vector info.
     if initial_sp is None or reset_vector is None:
-        return
+        return None
+
+    has_slot_range = slot_start is not None and slot_end is not None
+    rv_addr = reset_vector & ~1  # mask off Thumb bit
+
+    # Fast path: a genuine boot passes all three tests, so only build the
+    # diagnostics once one of them fails.
+    if (
+        _SRAM_START <= initial_sp < _SRAM_END
+        and reset_vector & 1
+        and (not has_slot_range or slot_start <= rv_addr < slot_end)
+    ):
+        return None
 
     problems: List[str] = []
 
@@ -287,8 +394,7 @@ def check_slot_integrity(result: FaultResult, **_: Any) -> None:
         )
 
     # Reset vector (ignoring Thumb bit) must be within the slot.
-    if slot_start is not None and slot_end is not None:
-        rv_addr = reset_vector & ~1  # mask off Thumb bit
+    if has_slot_range:
         if not (slot_start <= rv_addr < slot_end):
             problems.append(
                 "Reset vector address 0x{:08X} is outside slot range "
@@ -296,7 +402,7 @@ def check_slot_integrity(result: FaultResult, **_: Any) -> None:
             )
 
     if problems:
-        raise InvariantViolation(
+        return InvariantViolation(
             invariant_name="slot_integrity",
             description=(
                 "Boot reported success on slot {!r} but vector table looks "
@@ -312,6 +418,7 @@ def check_slot_integrity(result: FaultResult, **_: Any) -> None:
                 "boot_slot": result.boot_slot,
             },
         )
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -326,6 +433,22 @@ _ALL_INVARIANTS: List[InvariantFn] = [
     check_slot_integrity,
 ]
 
+# Context keywords a built-in check needs; when any is missing or None the
+# check would return immediately, so the runner skips calling it.  Checks
+# not listed here (including all custom checks) always run.
+_REQUIRED_CONTEXT: Dict[InvariantFn, Tuple[str, ...]] = {
+    check_at_least_one_bootable: ("pre_state",),
+    check_no_oob_writes: ("write_log", "partition_ranges"),
+}
+
+# Built-in checks that take a pre-normalized ``normalized_nvm`` keyword.  Only
+# these receive it, so custom checks without ``**kwargs`` keep working.
+_ACCEPTS_NORMALIZED_NVM = frozenset({
+    check_boot_matches_metadata,
+    check_metadata_single_fault_consistency,
+    check_slot_integrity,
+})
+
 
 def run_invariants(
     result: FaultResult,
@@ -340,6 +463,9 @@ def run_invariants(
             invariants.
         **context: Extra keyword arguments forwarded to each check function
             (e.g. ``pre_state``, ``write_log``, ``partition_ranges``).
+            ``normalized_nvm`` may be supplied to skip re-normalizing
+            ``result.nvm_state``; it is only passed to the built-in checks
+            that accept it.
 
     Returns:
         A list of :class:`InvariantViolation` objects.  Empty means all
@@ -348,15 +474,81 @@ def run_invariants(
     if invariants is None:
         invariants = _ALL_INVARIANTS
 
+    normalized_nvm = context.pop("normalized_nvm", None)
+    if normalized_nvm is None and any(fn in _ACCEPTS_NORMALIZED_NVM for fn in invariants):
+        normalized_nvm = _normalize_nvm(result.nvm_state)
+
     violations: List[InvariantViolation] = []
     for check_fn in invariants:
+        required = _REQUIRED_CONTEXT.get(check_fn)
+        if required is not None and any(context.get(key) is None for key in required):
+            continue
         try:
-            check_fn(result, **context)
-        except InvariantViolation as v:
-            violations.append(v)
+            if check_fn in _ACCEPTS_NORMALIZED_NVM:
+                violation = check_fn(result, normalized_nvm=normalized_nvm, **context)
+            else:
+                violation = check_fn(result, **context)
+        except InvariantViolation as exc:
+            violation = exc
+        if isinstance(violation, InvariantViolation):
+            violations.append(violation)
     return violations
 
 
+# Invariant list for the current batch worker process (set by the pool
+# initializer so it is pickled once per worker, not once per task).
+_BATCH_INVARIANTS: Optional[Sequence[InvariantFn]] = None
+
+
+def _init_batch_worker(invariants: Optional[Sequence[InvariantFn]]) -> None:
+    global _BATCH_INVARIANTS
+    _BATCH_INVARIANTS = invariants
+
+
+def _run_batch_item(
+    result: FaultResult, context: Dict[str, Any]
+) -> List[InvariantViolation]:
+    return run_invariants(result, invariants=_BATCH_INVARIANTS, **context)
+
+
+def run_invariants_batch(
+    results: Sequence[FaultResult],
+    invariants: Optional[Sequence[InvariantFn]] = None,
+    context_fn: Optional[Callable[[FaultResult], Dict[str, Any]]] = None,
+    workers: Optional[int] = None,
+) -> List[List[InvariantViolation]]:
+    """Run invariant checks over many FaultResults, in parallel by default.
+
+    Args:
+        results: The fault-injection results to validate.
+        invariants: Which checks to run (``None`` = all).  Must be picklable
+            (module-level functions) unless ``workers == 1``.
+        context_fn: Called in this process for each result to build the
+            keyword context passed to :func:`run_invariants`.
+        workers: Worker process count; ``None`` uses ``os.cpu_count()`` and
+            ``1`` runs serially in-process.
+
+    Returns:
+        One violation list per result, in ``results`` order.  Violations
+        from worker processes carry a copy of their FaultResult.
+    """
+    contexts = [context_fn(r) if context_fn is not None else {} for r in results]
+    if workers == 1 or len(results) < 2:
+        return [
+            run_invariants(r, invariants=invariants, **ctx)
+            for r, ctx in zip(results, contexts)
+        ]
+
+    n_workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(results) // (n_workers * 8))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_batch_worker,
+        initargs=(invariants,),
+    ) as pool:
+        return list(pool.map(_run_batch_item, results, contexts, chunksize=chunksize))
+
+
 # ---------------------------------------------------------------------------
 # Scenario presets
 # ---------------------------------------------------------------------------
@@ -378,3 +570,38 @@ def default_invariants(scenario: str) -> List[InvariantFn]:
     if scenario == "vulnerable":
         return [check_slot_integrity]
     return [check_at_least_one_bootable, check_slot_integrity]
+
+
+# ---------------------------------------------------------------------------
+# Self-check
+# ---------------------------------------------------------------------------
+
+def _self_check() -> int:
+    """Regression checks for the runner that need no emulator.
+
+    Legacy checks raise on failure and may return anything otherwise; only
+    ``InvariantViolation`` objects may end up in the result list.
+    """
+    result = FaultResult(
+        fault_at=0, boot_outcome="success", boot_slot="a",
+        nvm_state=None, raw_log="", is_control=False,
+    )
+
+    def legacy_status(result: FaultResult, **_: Any) -> bool:
+        return True
+
+    def legacy_raise(result: FaultResult, **_: Any) -> bool:
+        raise InvariantViolation("legacy_raise", "raised by a legacy check", result)
+
+    violations = run_invariants(result, invariants=[legacy_status])
+    assert violations == [], violations
+
+    violations = run_invariants(result, invariants=[legacy_status, legacy_raise])
+    assert [v.invariant_name for v in violations] == ["legacy_raise"], violations
+
+    print("invariants self-check: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_self_check())
@@ -24,6 +24,7 @@ import json
 import random
 import struct
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -363,15 +364,16 @@ def main() -> int:
 
     scenarios = generate_scenarios(args.count, args.seed, args.sectors)
     payload = [_scenario_dict(s) for s in scenarios]
-    text = json.dumps(payload, indent=2, sort_keys=True)
 
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(text + '\n')
+        with open(args.output, 'w', buffering=1 << 20) as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+            f.write('\n')
         print("Wrote {} scenarios to {}".format(len(scenarios), args.output),
               file=sys.stderr)
     else:
-        print(text)
+        json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
 
     if args.dump_blobs:
         import os
@@ -392,10 +394,7 @@ def main() -> int:
         swaps = sum(1 for p in preds if p.triggers_swap)
         s0 = sum(1 for p in preds if p.boot_slot == 0)
         s1 = sum(1 for p in preds if p.boot_slot == 1)
-        bugs: Dict[str, int] = {}
-        for s in scenarios:
-            if s.bug_class:
-                bugs[s.bug_class.value] = bugs.get(s.bug_class.value, 0) + 1
+        bugs = Counter(s.bug_class.value for s in scenarios if s.bug_class)
         pct = lambda v: "{:.1f}%".format(100.0 * v / n) if n else "0%"
         print("\nSummary ({} scenarios):".format(n), file=sys.stderr)
         print("  Boots: {} ({})".format(boots, pct(boots)), file=sys.stderr)
@@ -17,7 +17,13 @@ import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from fault_inject import FaultResult, MultiFaultResult, parse_fault_range, parse_multi_fault_spec
+from fault_inject import (
+    FaultResult,
+    MultiFaultResult,
+    parse_fault_range,
+    parse_multi_fault_spec,
+    result_to_dict,
+)
 
 DEFAULT_RENODE_TEST = os.environ.get("RENODE_TEST", "renode-test")
 DEFAULT_ROBOT_SUITE = "tests/ota_fault_point.robot"
@@ -694,7 +700,7 @@ def to_json_payload(
     }
 
     for name, entries in results.items():
-        payload["results"][name] = [dataclasses.asdict(e) for e in entries]
+        payload["results"][name] = [result_to_dict(e) for e in entries]
 
     if cfg.scenario == "comparative":
         payload["comparative_table"] = build_comparative_table(results["vulnerable"], results["resilient"])
@@ -849,12 +855,13 @@ def main() -> int:
                     "artifacts_dir": report_artifacts_dir,
                 },
                 "git": git_metadata(repo_root),
-                "results": [dataclasses.asdict(r) for r in mf_results],
+                "results": [result_to_dict(r) for r in mf_results],
             }
 
             out_path = Path(args.output)
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            with out_path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+                json.dump(payload, fp, indent=2, sort_keys=True)
 
             print(json.dumps(summary, indent=2, sort_keys=True))
 
@@ -948,7 +955,8 @@ def main() -> int:
 
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        with out_path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+            json.dump(payload, fp, indent=2, sort_keys=True)
 
         if args.table_output:
             table_path = Path(args.table_output)
@@ -18,10 +18,11 @@ import math
 import os
 import subprocess
 import sys
+import tempfile
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple
 
 import yaml
 
@@ -49,6 +50,7 @@ SCENARIO_TAG_ALIASES = {
     "copy_guard": "upgrade_copy_guard",
 }
 HEALTHY_OTADATA_STATES = {"NEW", "PENDING_VERIFY", "VALID"}
+OUTPUT_TAIL_CHARS = 2000
 
 
 @dataclass
@@ -429,13 +431,18 @@ def run_case(
     elif workers > 1:
         cmd.extend(["--workers", str(workers)])
 
-    proc = subprocess.run(
-        cmd,
-        cwd=str(repo_root),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    # Spool output to anonymous temp files instead of capturing it: only
+    # the tail is kept, and a verbose or stuck run can emit megabytes.
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(repo_root),
+            stdout=out,
+            stderr=err,
+            check=False,
+        )
+        stdout_tail = _read_tail(out, OUTPUT_TAIL_CHARS)
+        stderr_tail = _read_tail(err, OUTPUT_TAIL_CHARS)
 
     result = {
         "case_id": case.case_id,
@@ -444,13 +451,32 @@ def run_case(
         "report_path": case.report_path.as_posix(),
         "command": cmd,
     }
-    if proc.stdout:
-        result["stdout_tail"] = proc.stdout[-2000:]
-    if proc.stderr:
-        result["stderr_tail"] = proc.stderr[-2000:]
+    if stdout_tail:
+        result["stdout_tail"] = stdout_tail
+    if stderr_tail:
+        result["stderr_tail"] = stderr_tail
     return result
 
 
+def _read_tail(fp: BinaryIO, chars: int) -> str:
+    """Return the last ``chars`` characters written to a binary temp file."""
+    size = fp.seek(0, os.SEEK_END)
+    # UTF-8 needs at most 4 bytes per character, plus up to 3 bytes of a
+    # character cut by the seek.
+    start = max(0, size - 4 * chars - 3)
+    fp.seek(start)
+    data = fp.read()
+    if start:
+        # Begin decoding on a character boundary, not mid-sequence.
+        skip = 0
+        while skip < 3 and skip < len(data) and 0x80 <= data[skip] <= 0xBF:
+            skip += 1
+        data = data[skip:]
+    text = data.decode("utf-8", errors="replace")
+    # Universal newlines, as text-mode subprocess capture would give.
+    return text.replace("\r\n", "\n").replace("\r", "\n")[-chars:]
+
+
 def load_report(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
@@ -23,12 +23,13 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import json
 import random
 import struct
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -130,7 +131,7 @@ def _crc32_table() -> List[int]:
     return table
 
 
-_CRC_TABLE = _crc32_table()
+_CRC_TABLE = tuple(_crc32_table())
 
 
 def compute_metadata_crc(words: List[int]) -> int:
@@ -146,11 +147,8 @@ def compute_metadata_crc(words: List[int]) -> int:
         The CRC-32 value that should be stored in words[63].
     """
     crc = 0xFFFFFFFF
-    for w in words[:-1]:
-        for shift in (0, 8, 16, 24):
-            byte = (w >> shift) & 0xFF
-            crc = _CRC_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
-            crc &= 0xFFFFFFFF
+    for byte in struct.pack('<{}I'.format(len(words) - 1), *words[:-1]):
+        crc = _CRC_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
     return (~crc) & 0xFFFFFFFF
 
 
@@ -158,6 +156,10 @@ def compute_metadata_crc(words: List[int]) -> int:
 # Blob builders
 # ---------------------------------------------------------------------------
 
+# Precompiled layouts so the format strings are parsed once.
+_META_STRUCT = struct.Struct('<{}I'.format(BOOT_META_WORD_COUNT))
+_VECTORS_STRUCT = struct.Struct('<II')
+
 def build_metadata_blob(meta_state: Optional[MetadataState]) -> bytes:
     """Serialize a MetadataState into a 256-byte packed replica.
 
@@ -174,24 +176,50 @@ def build_metadata_blob(meta_state: Optional[MetadataState]) -> bytes:
     if meta_state is None:
         return b'\x00' * BOOT_META_REPLICA_SIZE
 
+    return _pack_metadata(
+        meta_state.seq,
+        meta_state.active_slot,
+        meta_state.target_slot,
+        meta_state.state,
+        meta_state.boot_count,
+        meta_state.max_boot_count,
+        meta_state.valid,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _pack_metadata(
+    seq: int,
+    active_slot: int,
+    target_slot: int,
+    state: int,
+    boot_count: int,
+    max_boot_count: int,
+    valid: bool,
+) -> bytes:
+    """Pack one replica from its field values.
+
+    Cached because fuzz campaigns repeat the same replica contents across
+    many scenarios; the result is immutable bytes so sharing is safe.
+    """
     words = [0] * BOOT_META_WORD_COUNT
     words[IDX_MAGIC] = BOOT_META_MAGIC
-    words[IDX_SEQ] = meta_state.seq & 0xFFFFFFFF
-    words[IDX_ACTIVE_SLOT] = meta_state.active_slot & 0xFFFFFFFF
-    words[IDX_TARGET_SLOT] = meta_state.target_slot & 0xFFFFFFFF
-    words[IDX_STATE] = meta_state.state & 0xFFFFFFFF
-    words[IDX_BOOT_COUNT] = meta_state.boot_count & 0xFFFFFFFF
-    words[IDX_MAX_BOOT_COUNT] = meta_state.max_boot_count & 0xFFFFFFFF
+    words[IDX_SEQ] = seq & 0xFFFFFFFF
+    words[IDX_ACTIVE_SLOT] = active_slot & 0xFFFFFFFF
+    words[IDX_TARGET_SLOT] = target_slot & 0xFFFFFFFF
+    words[IDX_STATE] = state & 0xFFFFFFFF
+    words[IDX_BOOT_COUNT] = boot_count & 0xFFFFFFFF
+    words[IDX_MAX_BOOT_COUNT] = max_boot_count & 0xFFFFFFFF
 
     crc = compute_metadata_crc(words)
 
-    if meta_state.valid:
+    if valid:
         words[IDX_CRC] = crc
     else:
         # Corrupt the CRC by flipping bits.
         words[IDX_CRC] = crc ^ 0xDEADBEEF
 
-    return struct.pack('<{}I'.format(BOOT_META_WORD_COUNT), *words)
+    return _META_STRUCT.pack(*words)
 
 
 def build_slot_vectors(slot_state: SlotState, slot_base: int) -> bytes:
@@ -223,12 +251,12 @@ def build_slot_vectors(slot_state: SlotState, slot_base: int) -> bytes:
         sp = SRAM_START + 0x1000  # Plausible stack pointer in SRAM.
         reset_pc = slot_base + 0x100  # Some offset into the slot.
         reset_vector = reset_pc | 1  # Thumb bit set.
-        return struct.pack('<II', sp, reset_vector)
+        return _VECTORS_STRUCT.pack(sp, reset_vector)
     else:
         # Invalid vectors: SP out of SRAM range, no thumb bit.
         sp = 0x00000000
         reset_vector = 0x00000000
-        return struct.pack('<II', sp, reset_vector)
+        return _VECTORS_STRUCT.pack(sp, reset_vector)
 
 
 # ---------------------------------------------------------------------------
@@ -258,7 +286,7 @@ def _vectors_valid_from_state(slot_state: SlotState, slot_base: int) -> bool:
     - reset_pc (without thumb bit) falls within the slot range
     """
     vec_bytes = build_slot_vectors(slot_state, slot_base)
-    sp, reset_vector = struct.unpack('<II', vec_bytes)
+    sp, reset_vector = _VECTORS_STRUCT.unpack(vec_bytes)
     reset_pc = reset_vector & ~1
 
     return (
@@ -436,27 +464,23 @@ def serialize_scenario_to_resc_vars(scenario: FuzzScenario) -> Dict[str, Any]:
 
     # Write replica 0.
     r0_blob = build_metadata_blob(scenario.replica0)
-    for i in range(0, BOOT_META_REPLICA_SIZE, 4):
-        word = struct.unpack_from('<I', r0_blob, i)[0]
-        writes.append((REPLICA_0_ADDR + i, word))
+    for i, word in enumerate(_META_STRUCT.unpack(r0_blob)):
+        writes.append((REPLICA_0_ADDR + 4 * i, word))
 
     # Write replica 1.
     r1_blob = build_metadata_blob(scenario.replica1)
-    for i in range(0, BOOT_META_REPLICA_SIZE, 4):
-        word = struct.unpack_from('<I', r1_blob, i)[0]
-        writes.append((REPLICA_1_ADDR + i, word))
+    for i, word in enumerate(_META_STRUCT.unpack(r1_blob)):
+        writes.append((REPLICA_1_ADDR + 4 * i, word))
 
     # Write slot A vectors (first 8 bytes).
     slot_a_vec = build_slot_vectors(scenario.slot_a, SLOT_A_BASE)
-    for i in range(0, 8, 4):
-        word = struct.unpack_from('<I', slot_a_vec, i)[0]
-        writes.append((SLOT_A_BASE + i, word))
+    for i, word in enumerate(_VECTORS_STRUCT.unpack(slot_a_vec)):
+        writes.append((SLOT_A_BASE + 4 * i, word))
 
     # Write slot B vectors (first 8 bytes).
     slot_b_vec = build_slot_vectors(scenario.slot_b, SLOT_B_BASE)
-    for i in range(0, 8, 4):
-        word = struct.unpack_from('<I', slot_b_vec, i)[0]
-        writes.append((SLOT_B_BASE + i, word))
+    for i, word in enumerate(_VECTORS_STRUCT.unpack(slot_b_vec)):
+        writes.append((SLOT_B_BASE + 4 * i, word))
 
     return {
         "writes": writes,
@@ -513,6 +537,15 @@ def generate_scenarios(count: int = 100, seed: Optional[int] = None) -> List[Fuz
     Returns:
         List of FuzzScenario instances.
     """
+    return list(iter_scenarios(count=count, seed=seed))
+
+
+def iter_scenarios(count: int = 100, seed: Optional[int] = None) -> Iterator[FuzzScenario]:
+    """Lazily yield the same scenarios as :func:`generate_scenarios`.
+
+    Random scenarios are built one at a time, so large campaigns can
+    consume them as they are produced instead of holding the whole list.
+    """
     rng = random.Random(seed)
     scenarios: List[FuzzScenario] = []
 
@@ -752,6 +785,7 @@ def generate_scenarios(count: int = 100, seed: Optional[int] = None) -> List[Fuz
         description="totally blank NVM -> hard fault",
     ))
 
+    yield from scenarios[:count]
     targeted_count = len(scenarios)
 
     # --- Random scenarios to fill the rest ---
@@ -838,16 +872,14 @@ def generate_scenarios(count: int = 100, seed: Optional[int] = None) -> List[Fuz
         slot_a = _random_slot(rng)
         slot_b = _random_slot(rng)
 
-        scenarios.append(FuzzScenario(
+        yield FuzzScenario(
             replica0=r0,
             replica1=r1,
             slot_a=slot_a,
             slot_b=slot_b,
             fault_at=None,
             description=desc,
-        ))
-
-    return scenarios[:count]
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -900,15 +932,15 @@ def main() -> int:
     scenarios = generate_scenarios(count=args.count, seed=args.seed)
     payload = [_scenario_to_dict(s) for s in scenarios]
 
-    json_text = json.dumps(payload, indent=2, sort_keys=True)
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(json_text)
+        with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
             f.write('\n')
         print("Wrote {} scenarios to {}".format(len(scenarios), args.output),
               file=sys.stderr)
     else:
-        print(json_text)
+        json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
 
     if args.summary:
         boots_count = sum(1 for s in scenarios if expected_outcome(s).boots)